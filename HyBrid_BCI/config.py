@@ -18,7 +18,7 @@ from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtWidgets import QApplication, QWidget, QCheckBox, QMessageBox, QFileDialog, QGroupBox
 from PyQt5.QtCore import Qt, pyqtSignal
 import numpy as np
-from ui_config import Ui_ConfigForm, UIManager
+from ui_config import Ui_ConfigForm, UIManager, ChannelCheckModel
 import locate
 
 # Configure comprehensive logging
@@ -60,6 +60,13 @@ class SensorType(Enum):
         return sensor_type in cls.get_all_types()
 
 
+SENSOR_TYPE_BITS = (
+    (SensorTypes.EEG, SensorType.EEG.value),
+    (SensorTypes.SEMG, SensorType.SEMG.value),
+    (SensorTypes.FNIRS, SensorType.FNIRS.value)
+)
+
+
 @dataclass
 class SensorConfig:
     """Configuration for individual sensor types"""
@@ -82,10 +89,12 @@ class DeviceConfiguration:
     channel_counts: Dict[str, int] = field(default_factory=dict)
     enabled_channels: Dict[str, Union[List[int], Dict]] = field(default_factory=dict)
     current_checkbox: Dict[str, Any] = field(default_factory=dict)
+    enabled_mask: int = field(init=False, default=SensorTypes.NotInit)
     
     def __post_init__(self):
         """Initialize configuration after object creation"""
         logger.info(f"Initializing DeviceConfiguration with sensors: {self.enabled_sensors}")
+        self.enabled_mask = sensor_types_to_mask(self.enabled_sensors)
         self._initialize_sensor_configs()
         self._initialize_default_settings()
     
@@ -180,15 +189,22 @@ class DeviceConfiguration:
         return {'errors': errors, 'warnings': warnings}
 
 
+def sensor_types_to_mask(sensor_types) -> int:
+    """Convert sensor type strings to integer sensor bit flags"""
+    mask = SensorTypes.NotInit
+    for sensor_bit, sensor_type in SENSOR_TYPE_BITS:
+        if sensor_type in sensor_types:
+            mask |= sensor_bit
+    return mask
+
+
 def parse_sensor_types(sensor_type_int: int) -> List[str]:
     """Convert integer sensor type to list of sensor strings"""
     sensor_list = []
     if sensor_type_int == SensorTypes.NotInit:
         return sensor_list
     
-    for sensor_bit, sensor_type in [(SensorTypes.EEG, SensorType.EEG.value),
-                                    (SensorTypes.SEMG, SensorType.SEMG.value),
-                                    (SensorTypes.FNIRS, SensorType.FNIRS.value)]:
+    for sensor_bit, sensor_type in SENSOR_TYPE_BITS:
         if sensor_type_int & sensor_bit:
             sensor_list.append(sensor_type)
     
@@ -265,9 +281,9 @@ class ConfigurationManager(QWidget, Ui_ConfigForm):
             self.sensor_checkboxes = {}
             for sensor in self.enabled_sensor_types:
                 if sensor == SensorType.FNIRS.value:
-                    self.sensor_checkboxes.update({'Source': [], 'Detect': []})
+                    self.sensor_checkboxes.update({'Source': ChannelCheckModel('Source'), 'Detect': ChannelCheckModel('Detect')})
                 else:
-                    self.sensor_checkboxes[sensor] = []
+                    self.sensor_checkboxes[sensor] = ChannelCheckModel(sensor)
             
             logger.debug("UI setup completed")
         except Exception as e:
@@ -551,10 +567,18 @@ class ConfigurationManager(QWidget, Ui_ConfigForm):
             
             # Update enabled channels list
             if sensor_type in self.sensor_checkboxes and sensor_type in self.config.enabled_channels:
-                checkboxes = self.sensor_checkboxes[sensor_type]
-                self.config.enabled_channels[sensor_type] = [
-                    i for i, checkbox in enumerate(checkboxes) if checkbox.isChecked()
-                ]
+                self.config.enabled_channels[sensor_type] = self.sensor_checkboxes[sensor_type].checked_indices()
+            
+        except Exception as e:
+            logger.error(f"Failed to update sensor channels for {sensor_type}: {e}")
+    
+    def update_sensor_channels_bulk(self, sensor_type: str, enabled_indices: List[int]):
+        """Update sensor channel configuration after a bulk change"""
+        try:
+            logger.debug(f"Updating {sensor_type} channels in bulk: {len(enabled_indices)} enabled")
+            
+            if sensor_type in self.config.enabled_channels:
+                self.config.enabled_channels[sensor_type] = enabled_indices
             
         except Exception as e:
             logger.error(f"Failed to update sensor channels for {sensor_type}: {e}")
@@ -8,7 +8,7 @@ import logging
 from pathlib import Path
 
 from PyQt5 import QtCore, QtGui, QtWidgets
-from ui_locate import Ui_Locate, Position3D
+from ui_locate import Ui_Locate, Position3D, pairwise_distances
 
 # ===================== LOGGING CONFIGURATION =====================
 
@@ -235,29 +235,34 @@ class ChannelCalculator:
         logger.info(f"Found {len(sources)} sources and {len(detectors)} detectors")
          
         valid_pairs = {}
+        if not sources or not detectors:
+            logger.info("Found 0 valid fNIRS channel pairs")
+            return valid_pairs
         
-        for source_num, source_info in sources.items():
-            for detector_num, detector_info in detectors.items():
-                try:
-                    s_pos = Position3D.from_tuple(source_info['position_3d'])
-                    d_pos = Position3D.from_tuple(detector_info['position_3d'])
-                    if s_pos and d_pos:
-                        distance = s_pos.distance_to(d_pos)
-                    
-                        if distance <= self.distance_threshold:
-                            channel_name = f'S{source_num}-D{detector_num}'
-                            valid_pairs[channel_name] = {
-                                'node_pair': f"{source_info['node_name']}-{detector_info['node_name']}",
-                                'distance': distance,
-                            }
-                            logger.info(f"Valid fNIRS pair: {channel_name}, "
-                                    f"distance: {distance:.2f}mm")
-                        else:
-                            logger.debug(f"Distance {distance:.2f}mm exceeds threshold "
-                                        f"for S{source_num}-D{detector_num}")
-                            
-                except Exception as e:
-                    logger.error(f"Error calculating distance for S{source_num}-D{detector_num}: {e}")
+        source_items = list(sources.items())
+        detector_items = list(detectors.items())
+        try:
+            distances = pairwise_distances([info['position_3d'] for _, info in source_items],
+                                           [info['position_3d'] for _, info in detector_items])
+        except Exception as e:
+            logger.error(f"Error calculating fNIRS pair distances: {e}")
+            return valid_pairs
+        
+        for i, (source_num, source_info) in enumerate(source_items):
+            for j, (detector_num, detector_info) in enumerate(detector_items):
+                distance = float(distances[i, j])
+                
+                if distance <= self.distance_threshold:
+                    channel_name = f'S{source_num}-D{detector_num}'
+                    valid_pairs[channel_name] = {
+                        'node_pair': f"{source_info['node_name']}-{detector_info['node_name']}",
+                        'distance': distance,
+                    }
+                    logger.info(f"Valid fNIRS pair: {channel_name}, "
+                            f"distance: {distance:.2f}mm")
+                else:
+                    logger.debug(f"Distance {distance:.2f}mm exceeds threshold "
+                                f"for S{source_num}-D{detector_num}")
         
         logger.info(f"Found {len(valid_pairs)} valid fNIRS channel pairs")
         return valid_pairs
@@ -488,13 +493,12 @@ class Locate(QtWidgets.QWidget):
         try:
             button.setText(str(number))
             
-            if hasattr(self.ui, 'get_style_for_type'):
+            if hasattr(self.ui, 'apply_electrode_style'):
                 button_size = "small" if button.width() < self.Config.ELECTRODE_SIZE else "normal"
-                style = self.ui.get_style_for_type(electrode_type.value, button_size)
-                button.setStyleSheet(style)
+                self.ui.apply_electrode_style(button, electrode_type.value, button_size)
                 logger.debug("Button style updated")
             else:
-                logger.warning("UI does not have get_style_for_type method")
+                logger.warning("UI does not have apply_electrode_style method")
             
         except Exception as e:
             logger.error(f"Error updating button appearance: {e}")
@@ -502,14 +506,14 @@ class Locate(QtWidgets.QWidget):
     def _restore_button_appearance(self, button: QtWidgets.QPushButton, electrode_name: str):
         """Restore button to original appearance."""
         try:
-            if hasattr(self.ui, 'get_style_for_type'):
+            if hasattr(self.ui, 'apply_electrode_style'):
                 if "_" in electrode_name:
                     button.setText("")
                     style_type = 'center' if len(electrode_name.split("_")) > 2 else 'middle'
-                    button.setStyleSheet(self.ui.get_style_for_type(style_type, 'small'))
+                    self.ui.apply_electrode_style(button, style_type, 'small')
                 else:
                     button.setText(electrode_name)
-                    button.setStyleSheet(self.ui.get_style_for_type('default'))
+                    self.ui.apply_electrode_style(button, 'default')
             logger.debug(f"Restored appearance for electrode: {electrode_name}")
             
         except Exception as e:
@@ -5,37 +5,52 @@ Enhanced UI Configuration Module
 Handles all UI-related operations for device configuration management
 """
 
-from typing import List, Dict, Set, Any, Optional, Union
+from functools import lru_cache
+from sys import intern
+from types import MappingProxyType
+from typing import List, Dict, Set, Any, Optional, Union, ClassVar, FrozenSet
 from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtWidgets import QCheckBox, QLabel, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox
+from PyQt5.QtWidgets import QLabel, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox
 from PyQt5.QtCore import Qt
 import numpy as np
 import logging
+import weakref
 import locate
 
 logger = logging.getLogger(__name__)
 
+# Sensor enable bits, same values as config.SensorTypes
+_EEG = 1
+_SEMG = 2
+_FNIRS = 4
+
 class UIConstants:
     """Constants for UI configuration"""
-    SENSOR_CONTROL_MAPPINGS = {
-        'sampling': {
-            'eeg': ['eegSamplingLabel', 'eegSamplingCombo'],
-            'fnirs': ['fnirsSamplingLabel', 'fnirsSamplingCombo'],
-            'semg': ['semgSamplingLabel', 'semgSamplingCombo']
-        },
-        'channels': {
-            'eeg': ['eegChannelsLabel_2', 'eegChannelsSpinBox_2'],
-            'semg': ['semgChannelsLabel_2', 'semgChannelsSpinBox_2'],
-            'fnirs': ['fnirsSourcesLabel_2', 'fnirsSourcesSpinBox_2', 
-                     'fnirsDetectorsLabel_2', 'fnirsDetectorsSpinBox_2']
-        }
-    }
+    SENSOR_CONTROL_MAPPINGS = MappingProxyType({
+        intern('sampling'): MappingProxyType({
+            intern('eeg'): ('eegSamplingLabel', 'eegSamplingCombo'),
+            intern('fnirs'): ('fnirsSamplingLabel', 'fnirsSamplingCombo'),
+            intern('semg'): ('semgSamplingLabel', 'semgSamplingCombo')
+        }),
+        intern('channels'): MappingProxyType({
+            intern('eeg'): ('eegChannelsLabel_2', 'eegChannelsSpinBox_2'),
+            intern('semg'): ('semgChannelsLabel_2', 'semgChannelsSpinBox_2'),
+            intern('fnirs'): ('fnirsSourcesLabel_2', 'fnirsSourcesSpinBox_2', 
+                              'fnirsDetectorsLabel_2', 'fnirsDetectorsSpinBox_2')
+        })
+    })
     
-    SAMPLING_CONFIG = {
-        'eeg': {'control': 'eegSamplingCombo', 'rates': [500, 1000, 2000]},
-        'fnirs': {'control': 'fnirsSamplingCombo', 'rates': [10, 20]},
-        'semg': {'control': 'semgSamplingCombo', 'rates': [500, 1000, 2000]}
-    }
+    SAMPLING_CONFIG = MappingProxyType({
+        intern('eeg'): MappingProxyType({'control': 'eegSamplingCombo', 'rates': (500, 1000, 2000)}),
+        intern('fnirs'): MappingProxyType({'control': 'fnirsSamplingCombo', 'rates': (10, 20)}),
+        intern('semg'): MappingProxyType({'control': 'semgSamplingCombo', 'rates': (500, 1000, 2000)})
+    })
+    
+    # Sampling rate -> 1-based device rate code, per sensor type
+    SAMPLING_RATE_INDEX = MappingProxyType({
+        sensor: MappingProxyType({rate: code for code, rate in enumerate(cfg['rates'], 1)})
+        for sensor, cfg in SAMPLING_CONFIG.items()
+    })
     
     SENSOR_COLORS = {
         'eeg': '#2196F3',
@@ -44,13 +59,157 @@ class UIConstants:
         'fnirs_detector': '#1040ff'
     }
 
+    # Shared form style sheet: sensor colors are selected by object name
+    FORM_STYLE_SHEET = (
+        "QGroupBox { font-weight: bold; } "
+        f"QGroupBox#eegGroupBox {{ color: {SENSOR_COLORS['eeg']}; }} "
+        f"QGroupBox#semgGroupBox {{ color: {SENSOR_COLORS['semg']}; }} "
+        f"QGroupBox#fnirsGroupBox {{ color: {SENSOR_COLORS['fnirs_source']}; }} "
+        f"QLabel#eegChannelsLabel_2 {{ font-weight: bold; color: {SENSOR_COLORS['eeg']}; }} "
+        f"QLabel#semgChannelsLabel_2 {{ font-weight: bold; color: {SENSOR_COLORS['semg']}; }} "
+        f"QLabel#fnirsSourcesLabel_2 {{ font-weight: bold; color: {SENSOR_COLORS['fnirs_source']}; }} "
+        f"QLabel#fnirsDetectorsLabel_2 {{ font-weight: bold; color: {SENSOR_COLORS['fnirs_detector']}; }}"
+    )
+
+    CHANNEL_ROW_HEIGHT = 24
+    CHANNEL_VIEW_MAX_ROWS = 12
+
+
+class ChannelCheckModel(QtCore.QAbstractTableModel):
+    """Checkable channel grid backed by a uint8 state array
+
+    Replaces one QCheckBox per channel: the view only paints the visible cells,
+    so large EEG/fNIRS channel counts no longer create one widget per channel.
+    """
+
+    # (sensor type, channel index, Qt check state)
+    channelStateChanged = QtCore.pyqtSignal(str, int, int)
+    channelsChanged = QtCore.pyqtSignal(str, list)
+
+    def __init__(self, sensor_type: str = "", count: int = 0, prefix: str = "", color: str = "#000000",
+                 columns: int = 8, parent=None):
+        super().__init__(parent)
+        self.sensor_type = sensor_type
+        self._prefix = prefix
+        self._columns = max(1, columns)
+        self._states = np.zeros(count, dtype=np.uint8)
+        self._labels = self._make_labels(count)
+        self._brush = QtGui.QBrush(QtGui.QColor(color))
+        self._font = QtGui.QFont()
+        self._font.setBold(True)
+
+    def __len__(self):
+        return len(self._states)
+
+    def _make_labels(self, count: int):
+        """Format the channel labels once instead of on every paint"""
+        prefix = self._prefix
+        return tuple(f"{prefix}{i:02d}" for i in range(1, count + 1))
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return -(-len(self._states) // self._columns)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._columns
+
+    def _channel_index(self, index) -> int:
+        """Map a model index to a channel index, -1 for padding cells"""
+        if not index.isValid():
+            return -1
+        channel_idx = index.row() * self._columns + index.column()
+        return channel_idx if channel_idx < len(self._states) else -1
+
+    def flags(self, index):
+        if self._channel_index(index) < 0:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def data(self, index, role=Qt.DisplayRole):
+        channel_idx = self._channel_index(index)
+        if channel_idx < 0:
+            return None
+        if role == Qt.DisplayRole:
+            return self._labels[channel_idx]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._states[channel_idx] else Qt.Unchecked
+        if role == Qt.ForegroundRole:
+            return self._brush
+        if role == Qt.FontRole:
+            return self._font
+        return None
+
+    def setData(self, index, value, role=Qt.CheckStateRole):
+        channel_idx = self._channel_index(index)
+        if channel_idx < 0 or role != Qt.CheckStateRole:
+            return False
+        checked = value == Qt.Checked
+        if bool(self._states[channel_idx]) == checked:
+            return True
+        self._states[channel_idx] = checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.channelStateChanged.emit(self.sensor_type, channel_idx, Qt.Checked if checked else Qt.Unchecked)
+        return True
+
+    def is_checked(self, channel_idx: int) -> bool:
+        return bool(self._states[channel_idx])
+
+    def checked_indices(self) -> List[int]:
+        """Get 0-based indices of all checked channels"""
+        return np.flatnonzero(self._states).tolist()
+
+    def set_checked_indices(self, indices, bulk: bool = False):
+        """Check exactly the given channels.
+
+        Emits one channelStateChanged per flipped channel, or a single
+        channelsChanged with all checked indices when bulk is set.
+        """
+        new_states = np.zeros_like(self._states)
+        idx = np.fromiter(indices, dtype=np.intp)
+        new_states[idx[(idx >= 0) & (idx < len(new_states))]] = 1
+        self._apply_states(new_states, bulk)
+
+    def clear_checks(self):
+        """Uncheck all channels"""
+        self._apply_states(np.zeros_like(self._states))
+
+    def clear(self):
+        """Drop all channels from the model"""
+        self.reset_channels(0)
+
+    def reset_channels(self, count: int):
+        """Resize the model to count unchecked channels"""
+        self.beginResetModel()
+        self._states = np.zeros(count, dtype=np.uint8)
+        if len(self._labels) != count:
+            self._labels = self._make_labels(count)
+        self.endResetModel()
+
+    def _apply_states(self, new_states: np.ndarray, bulk: bool = False):
+        changed = np.flatnonzero(self._states != new_states)
+        if not len(changed):
+            return
+        self._states = new_states
+        self.dataChanged.emit(self.index(0, 0),
+                              self.index(self.rowCount() - 1, self._columns - 1),
+                              [Qt.CheckStateRole])
+        if bulk:
+            self.channelsChanged.emit(self.sensor_type, self.checked_indices())
+            return
+        for channel_idx in changed.tolist():
+            self.channelStateChanged.emit(self.sensor_type, channel_idx,
+                                          Qt.Checked if new_states[channel_idx] else Qt.Unchecked)
+
 
 class Ui_ConfigForm(object):
     def setupUi(self, ConfigForm):
         ConfigForm.setObjectName("ConfigForm")
         ConfigForm.resize(1188, 838)
         ConfigForm.setWindowTitle("Device Configuration")
-        ConfigForm.setStyleSheet("QGroupBox { font-weight: bold; }")
+        ConfigForm.setStyleSheet(UIConstants.FORM_STYLE_SHEET)
 
         # Sampling Rate Configuration Group
         self._setup_sampling_rate_group(ConfigForm)
@@ -80,51 +239,38 @@ class Ui_ConfigForm(object):
     def _setup_sampling_controls(self):
         """Setup individual sampling rate controls"""
         # EEG Sampling Rate
-        self.eegSamplingLabel = QtWidgets.QLabel(self.samplingRateWidget)
-        self.eegSamplingLabel.setText("EEG (Hz):")
-        self.eegSamplingLabel.setObjectName("eegSamplingLabel")
-        self.samplingRateLayout.addWidget(self.eegSamplingLabel)
-
-        self.eegSamplingCombo = QtWidgets.QComboBox(self.samplingRateWidget)
-        self.eegSamplingCombo.setObjectName("eegSamplingCombo")
-        self.eegSamplingCombo.addItems(["500", "1000", "2000"])
-        self.eegSamplingCombo.setCurrentText("1000")
-        self.samplingRateLayout.addWidget(self.eegSamplingCombo)
-
-        self._add_spacer()
+        self._add_sampling_control("EEG (Hz):", "eegSamplingLabel", "eegSamplingCombo",
+                                   ["500", "1000", "2000"], "1000")
 
         # fNIRS Sampling Rate
-        self.fnirsSamplingLabel = QtWidgets.QLabel(self.samplingRateWidget)
-        self.fnirsSamplingLabel.setText("fNIRS (Hz):")
-        self.fnirsSamplingLabel.setObjectName("fnirsSamplingLabel")
-        self.samplingRateLayout.addWidget(self.fnirsSamplingLabel)
+        self._add_sampling_control("fNIRS (Hz):", "fnirsSamplingLabel", "fnirsSamplingCombo",
+                                   ["10", "20", "50"], "10")
 
-        self.fnirsSamplingCombo = QtWidgets.QComboBox(self.samplingRateWidget)
-        self.fnirsSamplingCombo.setObjectName("fnirsSamplingCombo")
-        self.fnirsSamplingCombo.addItems(["10", "20", "50"])
-        self.fnirsSamplingCombo.setCurrentText("10")
-        self.samplingRateLayout.addWidget(self.fnirsSamplingCombo)
+        # sEMG Sampling Rate
+        self._add_sampling_control("sEMG (Hz):", "semgSamplingLabel", "semgSamplingCombo",
+                                   ["500", "1000", "2000"], "1000")
 
-        self._add_spacer()
+    def _add_sampling_control(self, label_text: str, label_name: str, combo_name: str,
+                              rates: List[str], default_rate: str):
+        """Add a sampling rate label, combo box and spacer as one sub-layout"""
+        layout = QtWidgets.QHBoxLayout()
 
-        # sEMG Sampling Rate
-        self.semgSamplingLabel = QtWidgets.QLabel(self.samplingRateWidget)
-        self.semgSamplingLabel.setText("sEMG (Hz):")
-        self.semgSamplingLabel.setObjectName("semgSamplingLabel")
-        self.samplingRateLayout.addWidget(self.semgSamplingLabel)
+        label = QtWidgets.QLabel(self.samplingRateWidget)
+        label.setText(label_text)
+        label.setObjectName(label_name)
+        layout.addWidget(label)
 
-        self.semgSamplingCombo = QtWidgets.QComboBox(self.samplingRateWidget)
-        self.semgSamplingCombo.setObjectName("semgSamplingCombo")
-        self.semgSamplingCombo.addItems(["500", "1000", "2000"])
-        self.semgSamplingCombo.setCurrentText("1000")
-        self.samplingRateLayout.addWidget(self.semgSamplingCombo)
+        combo = QtWidgets.QComboBox(self.samplingRateWidget)
+        combo.setObjectName(combo_name)
+        combo.addItems(rates)
+        combo.setCurrentText(default_rate)
+        layout.addWidget(combo)
 
-        self._add_spacer()
+        layout.addItem(QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum))
 
-    def _add_spacer(self):
-        """Add horizontal spacer"""
-        spacer = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.samplingRateLayout.addItem(spacer)
+        self.samplingRateLayout.addLayout(layout)
+        setattr(self, label_name, label)
+        setattr(self, combo_name, combo)
 
     def _setup_channel_config_group(self, ConfigForm):
         """Setup channel configuration group"""
@@ -192,28 +338,23 @@ class Ui_ConfigForm(object):
     def _setup_sensor_param_controls(self):
         """Setup sensor parameter controls"""
         # EEG Channels
-        self._add_sensor_control("EEG通道数:", "eegChannelsLabel_2", "eegChannelsSpinBox_2", 
-                                UIConstants.SENSOR_COLORS['eeg'], 1, 256, 32)
+        self._add_sensor_control("EEG通道数:", "eegChannelsLabel_2", "eegChannelsSpinBox_2", 1, 256, 32)
         
         # sEMG Channels
-        self._add_sensor_control("sEMG通道数:", "semgChannelsLabel_2", "semgChannelsSpinBox_2", 
-                                UIConstants.SENSOR_COLORS['semg'], 1, 64, 8)
+        self._add_sensor_control("sEMG通道数:", "semgChannelsLabel_2", "semgChannelsSpinBox_2", 1, 64, 8)
         
         # fNIRS Sources
-        self._add_sensor_control("fNIRS光源数:", "fnirsSourcesLabel_2", "fnirsSourcesSpinBox_2", 
-                                UIConstants.SENSOR_COLORS['fnirs_source'], 1, 32, 8)
+        self._add_sensor_control("fNIRS光源数:", "fnirsSourcesLabel_2", "fnirsSourcesSpinBox_2", 1, 32, 8)
         
         # fNIRS Detectors
-        self._add_sensor_control("fNIRS探测器数:", "fnirsDetectorsLabel_2", "fnirsDetectorsSpinBox_2", 
-                                UIConstants.SENSOR_COLORS['fnirs_detector'], 1, 32, 8)
+        self._add_sensor_control("fNIRS探测器数:", "fnirsDetectorsLabel_2", "fnirsDetectorsSpinBox_2", 1, 32, 8)
 
     def _add_sensor_control(self, label_text: str, label_name: str, spinbox_name: str, 
-                           color: str, min_val: int, max_val: int, default_val: int):
-        """Add a sensor control group"""
+                           min_val: int, max_val: int, default_val: int):
+        """Add a sensor control group (colored by the form style sheet)"""
         layout = QtWidgets.QHBoxLayout()
         
         label = QtWidgets.QLabel(self.deviceParamsWidget)
-        label.setStyleSheet(f"font-weight: bold; color: {color};")
         label.setText(label_text)
         label.setObjectName(label_name)
         layout.addWidget(label)
@@ -263,11 +404,56 @@ class Ui_ConfigForm(object):
         self.channelConfigGroup.setTitle(_translate("ConfigForm", "通道配置"))
 
 
+# Brain control buttons: (attribute name, text, color)
+_BRAIN_BUTTON_SPECS = (
+    ('reset_locator_btn', '重置', '#f44336'),
+    ('finish_locator_btn', '完成', '#4CAF50')
+)
+
+# Button style sheets keyed by base color, filled on first use
+_BUTTON_QSS: Dict[str, str] = {}
+
+
+def _to_index_set(channels) -> Set[int]:
+    """Normalize loaded channel keys to a set of 0-based indices.
+
+    Lists hold 0-based int indices; dicts are keyed by 1-based channel
+    numbers as digit strings (or 0-based ints).
+    """
+    if isinstance(channels, dict):
+        return {int(key) - 1 if isinstance(key, str) else key
+                for key in channels
+                if isinstance(key, int) or (isinstance(key, str) and key.isdigit())}
+    if isinstance(channels, list):
+        return {idx for idx in channels if isinstance(idx, int)}
+    return set()
+
+
+def _brain_button_rects(width: int):
+    """Geometries of the brain control buttons for a given tab width"""
+    return (QtCore.QRect(min(width - 180, 580), 10, 80, 30),
+            QtCore.QRect(min(width - 90, 670), 10, 80, 30))
+
+
 class UIManager:
     """Manages UI operations and customization"""
     
+    _BRAIN_SENSORS: ClassVar[FrozenSet[str]] = frozenset(('eeg', 'fnirs'))
+    
+    _BUTTON_STYLE_TEMPLATE = (
+        "QPushButton {{ background-color: {color}; color: white; border: none; "
+        "border-radius: 4px; font-weight: bold; }} "
+        "QPushButton:hover {{ background-color: {hover}; }} "
+        "QPushButton:pressed {{ background-color: {pressed}; }}"
+    )
+    
     def __init__(self, parent):
-        self.parent = parent
+        # Weak back-reference: the parent widget owns this manager
+        self.parent = weakref.proxy(parent)
+        # Channel group key -> (view, model) currently shown in the form
+        self._channel_views: Dict[str, tuple] = {}
+        # Sensor type -> sampling rate combo box (None if not present)
+        self._control_cache: Dict[str, Any] = {}
         logger.info("UIManager initialized")
 
     def setup_ui_for_sensors(self, enabled_sensor_types: Set[str]):
@@ -282,9 +468,17 @@ class UIManager:
                     if hasattr(self.parent, control_name):
                         getattr(self.parent, control_name).setVisible(visible)
         
+        self._refresh_control_cache()
         self._customize_tab_widget(enabled_sensor_types)
         logger.debug("UI setup for sensors completed")
 
+    def _refresh_control_cache(self):
+        """Look up the sampling rate controls once"""
+        self._control_cache = {
+            sensor: getattr(self.parent, cfg['control'], None)
+            for sensor, cfg in UIConstants.SAMPLING_CONFIG.items()
+        }
+
     def _customize_tab_widget(self, enabled_sensor_types: Set[str]):
         """Customize tab widget based on sensor associations"""
         if not hasattr(self.parent, 'configTabWidget'):
@@ -295,8 +489,7 @@ class UIManager:
             self.parent.configTabWidget.removeTab(0)
         
         # Add tabs based on enabled sensors
-        brain_sensors = {'eeg', 'fnirs'}
-        if brain_sensors.intersection(enabled_sensor_types):
+        if self._BRAIN_SENSORS & enabled_sensor_types:
             self._add_brain_configuration_tab(enabled_sensor_types)
         
         if 'semg' in enabled_sensor_types:
@@ -324,7 +517,7 @@ class UIManager:
 
             # Add sensor sections
             if 'eeg' in enabled_sensor_types:
-                self._add_sensor_group_box("EEG", "EEG通道配置", UIConstants.SENSOR_COLORS['eeg'])
+                self._add_sensor_group_box("EEG", "EEG通道配置")
             
             if 'fnirs' in enabled_sensor_types:
                 self._add_fnirs_section()
@@ -336,10 +529,10 @@ class UIManager:
             logger.error(f"Failed to create brain configuration tab: {e}")
             raise
 
-    def _add_sensor_group_box(self, sensor_key: str, title: str, color: str):
+    def _add_sensor_group_box(self, sensor_key: str, title: str):
         """Add a generic sensor group box"""
         group_box = QGroupBox(title)
-        group_box.setStyleSheet(f"QGroupBox {{ font-weight: bold; color: {color}; }}")
+        group_box.setObjectName(f"{sensor_key.lower()}GroupBox")
         
         grid_layout = QtWidgets.QGridLayout(group_box)
         setattr(self.parent, f"{sensor_key.lower()}GroupBox", group_box)
@@ -350,7 +543,7 @@ class UIManager:
     def _add_fnirs_section(self):
         """Add fNIRS section to brain configuration tab"""
         self.parent.fnirsGroupBox = QGroupBox("fNIRS通道配置")
-        self.parent.fnirsGroupBox.setStyleSheet("QGroupBox { font-weight: bold; color: #E91E63; }")
+        self.parent.fnirsGroupBox.setObjectName("fnirsGroupBox")
         
         self.parent.fnirsMainLayout = QtWidgets.QVBoxLayout(self.parent.fnirsGroupBox)
         self.parent.fnirsGridLayout = QtWidgets.QGridLayout()
@@ -359,21 +552,34 @@ class UIManager:
         self.parent.brainMainLayout.addWidget(self.parent.fnirsGroupBox)
 
     def _add_brain_locator_widget(self):
-        """Add brain electrode locator widget"""
+        """Add brain electrode locator widget once the tab has been shown"""
+        self._create_placeholder_locator_widget("Loading locator...")
+        QtCore.QTimer.singleShot(0, self._deferred_create_locator)
+
+    def _deferred_create_locator(self):
+        """Replace the placeholder with the electrode locator"""
         try:
-            self.parent.brain_config_right = locate.Locate() # type: ignore
-            self.parent.brain_config_right.setParent(self.parent.brainTab)
-            self.parent.brain_config_right.setGeometry(QtCore.QRect(570, 5, 560, 560))
+            placeholder = self.parent.brain_config_right
+            locator = locate.Locate() # type: ignore
+            locator.setParent(self.parent.brainTab)
+            locator.setGeometry(QtCore.QRect(570, 5, 560, 560))
+            self.parent.brain_config_right = locator
+            placeholder.deleteLater()
+            locator.show()
+        except ReferenceError:
+            logger.debug("Configuration form closed before locator creation")
         except Exception as e:
             logger.error(f"Failed to add brain locator widget: {e}")
+            self.parent.brain_config_right.deleteLater()
             self._create_placeholder_locator_widget()
+            self.parent.brain_config_right.show()
 
-    def _create_placeholder_locator_widget(self):
+    def _create_placeholder_locator_widget(self, text: str = "Locator not available"):
         """Create placeholder widget when locator is unavailable"""
         self.parent.brain_config_right = QtWidgets.QWidget(self.parent.brainTab)
         self.parent.brain_config_right.setGeometry(QtCore.QRect(570, 5, 560, 560))
         layout = QVBoxLayout(self.parent.brain_config_right)
-        layout.addWidget(QLabel("Locator not available"))
+        layout.addWidget(QLabel(text))
 
     def _add_trunk_configuration_tab(self):
         """Add Trunk Configuration tab for sEMG"""
@@ -392,7 +598,7 @@ class UIManager:
 
             # Add sEMG group box
             self.parent.semgGroupBox = QGroupBox("sEMG通道配置")
-            self.parent.semgGroupBox.setStyleSheet(f"QGroupBox {{ font-weight: bold; color: {UIConstants.SENSOR_COLORS['semg']}; }}")
+            self.parent.semgGroupBox.setObjectName("semgGroupBox")
             
             self.parent.semgGridLayout = QtWidgets.QGridLayout(self.parent.semgGroupBox)
             
@@ -429,32 +635,31 @@ class UIManager:
 
     def _initialize_sampling_rates(self, config):
         """Initialize sampling rate controls"""
-        for sensor, control_name in [
-            ('eeg', 'eegSamplingCombo'),
-            ('fnirs', 'fnirsSamplingCombo'),
-            ('semg', 'semgSamplingCombo')
-        ]:
-            if sensor in config.enabled_sensors and hasattr(self.parent, control_name):
-                control = getattr(self.parent, control_name)
+        for sensor_bit, sensor in [(_EEG, 'eeg'), (_FNIRS, 'fnirs'), (_SEMG, 'semg')]:
+            control = self._control_cache.get(sensor)
+            if config.enabled_mask & sensor_bit and control is not None:
                 rate = config.sampling_rates[sensor]
                 control.setCurrentText(str(rate))
                 control.currentIndexChanged.connect(self.parent.modify_sample_rate)
 
     def _initialize_channel_counts(self, config):
         """Initialize channel count controls"""
+        if not config.enabled_mask:
+            return
+        
         channel_controls = [
-            ('eeg', 'eegChannelsSpinBox_2'),
-            ('semg', 'semgChannelsSpinBox_2')
+            (_EEG, 'eeg', 'eegChannelsSpinBox_2'),
+            (_SEMG, 'semg', 'semgChannelsSpinBox_2')
         ]
         
-        for sensor, control_name in channel_controls:
-            if sensor in config.enabled_sensors and hasattr(self.parent, control_name):
+        for sensor_bit, sensor, control_name in channel_controls:
+            if config.enabled_mask & sensor_bit and hasattr(self.parent, control_name):
                 control = getattr(self.parent, control_name)
                 count = config.channel_counts[sensor]
                 control.setValue(count)
         
         # fNIRS special handling
-        if 'fnirs' in config.enabled_sensors:
+        if config.enabled_mask & _FNIRS:
             fnirs_controls = [
                 ('fnirsSourcesSpinBox_2', 'fnirs_sources'),
                 ('fnirsDetectorsSpinBox_2', 'fnirs_detectors')
@@ -470,18 +675,21 @@ class UIManager:
 
     def _connect_channel_controls(self, config, parent):
         """Connect channel control signals"""
-        channel_controls = {
-            'eeg': 'eegChannelsSpinBox_2',
-            'semg': 'semgChannelsSpinBox_2'
-        }
+        if not config.enabled_mask:
+            return
+        
+        channel_controls = [
+            (_EEG, 'eeg', 'eegChannelsSpinBox_2'),
+            (_SEMG, 'semg', 'semgChannelsSpinBox_2')
+        ]
         
-        for sensor, control_name in channel_controls.items():
-            if sensor in config.enabled_sensors and hasattr(parent, control_name):
+        for sensor_bit, sensor, control_name in channel_controls:
+            if config.enabled_mask & sensor_bit and hasattr(parent, control_name):
                 getattr(parent, control_name).valueChanged.connect(
                     lambda sensor=sensor: parent._safe_update_channel_configuration(sensor))
         
         # fNIRS special handling
-        if 'fnirs' in config.enabled_sensors:
+        if config.enabled_mask & _FNIRS:
             for control_name in ['fnirsSourcesSpinBox_2', 'fnirsDetectorsSpinBox_2']:
                 if hasattr(parent, control_name):
                     getattr(parent, control_name).valueChanged.connect(
@@ -491,16 +699,16 @@ class UIManager:
         """Update channel counts from UI spinboxes"""
         try:
             channel_mappings = [
-                ('eeg', 'eegChannelsSpinBox_2'),
-                ('semg', 'semgChannelsSpinBox_2')
+                (_EEG, 'eeg', 'eegChannelsSpinBox_2'),
+                (_SEMG, 'semg', 'semgChannelsSpinBox_2')
             ]
             
-            for sensor, control_name in channel_mappings:
-                if sensor in config.enabled_sensors and hasattr(self.parent, control_name):
+            for sensor_bit, sensor, control_name in channel_mappings:
+                if config.enabled_mask & sensor_bit and hasattr(self.parent, control_name):
                     config.channel_counts[sensor] = getattr(self.parent, control_name).value()
             
             # fNIRS special handling
-            if 'fnirs' in config.enabled_sensors:
+            if config.enabled_mask & _FNIRS:
                 fnirs_mappings = [
                     ('fnirsSourcesSpinBox_2', 'fnirs_sources'),
                     ('fnirsDetectorsSpinBox_2', 'fnirs_detectors')
@@ -516,8 +724,7 @@ class UIManager:
     def add_control_buttons(self, enabled_sensor_types: Set[str], parent):
         """Add control buttons for brain configuration"""
         try:
-            brain_sensors = {'eeg', 'fnirs'}
-            if brain_sensors.intersection(enabled_sensor_types) and hasattr(parent, 'brainTab'):
+            if self._BRAIN_SENSORS & enabled_sensor_types and hasattr(parent, 'brainTab'):
                 self._add_brain_control_buttons(parent)
         except Exception as e:
             logger.error(f"Failed to add control buttons: {e}")
@@ -529,32 +736,31 @@ class UIManager:
                 logger.warning("Brain tab or config widget not available")
                 return
             
-            self._remove_existing_control_buttons(parent)
-            
-            # Create buttons with common styling
-            button_configs = [
-                ('reset_locator_btn', '重置', '#f44336', self._get_reset_callback(parent)),
-                ('finish_locator_btn', '完成', '#4CAF50', self._get_finish_callback(parent))
-            ]
+            callbacks = (self._get_reset_callback(parent), self._get_finish_callback(parent))
             
             parent_width = parent.brainTab.width() if parent.brainTab.width() > 0 else 1140
+            rects = _brain_button_rects(parent_width)
             
-            for i, (name, text, color, callback) in enumerate(button_configs):
+            if self._reuse_brain_control_buttons(parent, callbacks, rects):
+                return
+            
+            self._remove_existing_control_buttons(parent)
+            
+            # Create buttons with common styling
+            for (name, text, color), callback, rect in zip(_BRAIN_BUTTON_SPECS, callbacks, rects):
                 button = QtWidgets.QPushButton(parent.brainTab)
                 button.setObjectName(name)
                 button.setText(text)
-                button.setStyleSheet(self._get_button_style(color))
-                
-                # Position buttons
-                x_pos = min(parent_width - (180 - i * 90), 580 + i * 90)
-                button.setGeometry(QtCore.QRect(x_pos, 10, 80, 30))
+                button.setAttribute(Qt.WA_StyledBackground, True)
+                button.setStyleSheet(self._get_cached_button_style(color))
+                button.setGeometry(rect)
                 
                 button.clicked.connect(callback)
                 button.show()
                 button.raise_()
                 
                 setattr(parent, name, button)
-                logger.info(f"Created {name} at position ({x_pos}, 10)")
+                logger.info(f"Created {name} at position ({rect.x()}, {rect.y()})")
             
             if hasattr(parent.brainTab, 'update'):
                 parent.brainTab.update()
@@ -562,33 +768,51 @@ class UIManager:
         except Exception as e:
             logger.error(f"Failed to add brain control buttons: {e}")
 
+    def _reuse_brain_control_buttons(self, parent, callbacks, rects) -> bool:
+        """Rebind and re-show existing control buttons, return False if they must be created"""
+        buttons = [getattr(parent, name, None) for name, _, _ in _BRAIN_BUTTON_SPECS]
+        if any(button is None or button.parent() is not parent.brainTab for button in buttons):
+            return False
+        
+        for button, callback, rect in zip(buttons, callbacks, rects):
+            try:
+                button.clicked.disconnect()
+            except TypeError:
+                pass
+            button.clicked.connect(callback)
+            button.setGeometry(rect)
+            button.show()
+            button.raise_()
+        
+        logger.debug("Reused existing brain control buttons")
+        return True
+
+    def _get_cached_button_style(self, color: str) -> str:
+        """Get button style string, building it once per color"""
+        style = _BUTTON_QSS.get(color)
+        if style is None:
+            style = _BUTTON_QSS[color] = self._get_button_style(color)
+        return style
+
     def _get_button_style(self, color: str) -> str:
         """Get button style string"""
-        return f"""
-            QPushButton {{ 
-                background-color: {color}; 
-                color: white; 
-                border: none; 
-                border-radius: 4px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{ 
-                background-color: {self._darken_color(color)}; 
-            }}
-            QPushButton:pressed {{ 
-                background-color: {self._darken_color(color, 0.8)}; 
-            }}
-        """
-
-    def _darken_color(self, hex_color: str, factor: float = 0.9) -> str:
+        return self._BUTTON_STYLE_TEMPLATE.format(
+            color=color,
+            hover=self._darken_color(color),
+            pressed=self._darken_color(color, 0.8))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _darken_color(hex_color: str, factor: float = 0.9) -> str:
         """Darken a hex color by a factor"""
         try:
-            hex_color = hex_color.lstrip('#')
-            rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            darkened = tuple(int(c * factor) for c in rgb)
-            return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
-        except:
-            return hex_color
+            value = int(hex_color.lstrip('#'), 16)
+            r = int(((value >> 16) & 0xff) * factor)
+            g = int(((value >> 8) & 0xff) * factor)
+            b = int((value & 0xff) * factor)
+            return "#%02x%02x%02x" % (r, g, b)
+        except ValueError:
+            return hex_color.lstrip('#')
 
     def _get_reset_callback(self, parent):
         """Get reset button callback"""
@@ -640,8 +864,7 @@ class UIManager:
             checkbox_groups = ['Source', 'Detect'] + list(self.parent.enabled_sensor_types)
             for group in checkbox_groups:
                 if group in self.parent.sensor_checkboxes:
-                    for checkbox in self.parent.sensor_checkboxes[group]:
-                        checkbox.setChecked(False)
+                    self.parent.sensor_checkboxes[group].clear_checks()
             
             self.parent._show_info_message("Reset Complete", "电极配置已重置")
             
@@ -665,7 +888,7 @@ class UIManager:
 
     def generate_standard_sensor_config(self, sensor_type: str, config, sensor_checkboxes: Dict, parent):
         """Generate standard sensor configuration (EEG/sEMG)"""
-        logger.info(f"Generating {sensor_type} configuration")
+        logger.debug("Generating %s configuration", sensor_type)
         
         try:
             layout_name = f"{sensor_type}GridLayout"
@@ -674,24 +897,23 @@ class UIManager:
                 return
             
             layout = getattr(parent, layout_name)
-            self._clear_layout(layout)
-            sensor_checkboxes[sensor_type].clear()
-            
             sensor_config = config.sensor_configs[sensor_type]
             channel_count = config.channel_counts[sensor_type]
             
-            for i in range(channel_count):
-                row, col = divmod(i, sensor_config.channels_per_row)
-                
-                checkbox = QCheckBox(f"{sensor_config.prefix}{i+1:02d}")
-                checkbox.setStyleSheet(f"QCheckBox {{ color: {sensor_config.color}; font-weight: bold; }}")
-                checkbox.stateChanged.connect(
-                    lambda state, idx=i: parent.update_sensor_channels(sensor_type, idx, state))
+            # Rebuild the group without intermediate relayouts/repaints
+            parent.setUpdatesEnabled(False)
+            try:
+                if not self._can_reuse_channel_view(sensor_type, sensor_checkboxes):
+                    self._clear_layout(layout)
+                    self._channel_views.pop(sensor_type, None)
+                    sensor_checkboxes[sensor_type].clear()
                 
-                layout.addWidget(checkbox, row, col)
-                sensor_checkboxes[sensor_type].append(checkbox)
+                self._bind_channel_view(sensor_type, channel_count, sensor_config.prefix, sensor_config.color,
+                                        sensor_config.channels_per_row, layout, 0, sensor_checkboxes, parent)
+            finally:
+                parent.setUpdatesEnabled(True)
             
-            logger.info(f"Generated {channel_count} {sensor_type} channel checkboxes")
+            logger.info("Generated %d %s channel checkboxes", channel_count, sensor_type)
             
         except Exception as e:
             logger.error(f"Failed to generate {sensor_type} configuration: {e}")
@@ -699,17 +921,13 @@ class UIManager:
 
     def generate_fnirs_configuration(self, config, sensor_checkboxes: Dict, parent):
         """Generate fNIRS source-detector matrix configuration"""
-        logger.info("Generating fNIRS configuration")
+        logger.debug("Generating fNIRS configuration")
         
         try:
             if not hasattr(parent, 'fnirsGridLayout'):
                 logger.warning("fNIRS grid layout not available")
                 return
             
-            self._clear_layout(parent.fnirsGridLayout)
-            sensor_checkboxes['Source'].clear()
-            sensor_checkboxes['Detect'].clear()
-            
             # Update counts from UI
             self._update_fnirs_counts_from_ui(config, parent)
             
@@ -717,12 +935,23 @@ class UIManager:
             source_count = config.channel_counts['fnirs_sources']
             detector_count = config.channel_counts['fnirs_detectors']
             
-            # Generate sources and detectors
-            self._generate_fnirs_components('Source', source_count, sensor_config, 0, sensor_checkboxes, parent)
-            source_rows = int(np.ceil(source_count / sensor_config.channels_per_row))
-            self._generate_fnirs_components('Detect', detector_count, sensor_config, source_rows, sensor_checkboxes, parent)
+            # Rebuild the group without intermediate relayouts/repaints
+            parent.setUpdatesEnabled(False)
+            try:
+                if not (self._can_reuse_channel_view('Source', sensor_checkboxes) and
+                        self._can_reuse_channel_view('Detect', sensor_checkboxes)):
+                    self._clear_layout(parent.fnirsGridLayout)
+                    for key in ('Source', 'Detect'):
+                        self._channel_views.pop(key, None)
+                        sensor_checkboxes[key].clear()
+                
+                # Generate sources and detectors
+                self._generate_fnirs_components('Source', source_count, sensor_config, 0, sensor_checkboxes, parent)
+                self._generate_fnirs_components('Detect', detector_count, sensor_config, 1, sensor_checkboxes, parent)
+            finally:
+                parent.setUpdatesEnabled(True)
             
-            logger.info(f"Generated {source_count} source and {detector_count} detector checkboxes")
+            logger.info("Generated %d source and %d detector checkboxes", source_count, detector_count)
             
         except Exception as e:
             logger.error(f"Failed to generate fNIRS configuration: {e}")
@@ -730,7 +959,7 @@ class UIManager:
 
     def _update_fnirs_counts_from_ui(self, config, parent):
         """Update fNIRS counts from UI"""
-        if 'fnirs' in config.enabled_sensors:
+        if config.enabled_mask & _FNIRS:
             for control_name, count_key in [
                 ('fnirsSourcesSpinBox_2', 'fnirs_sources'),
                 ('fnirsDetectorsSpinBox_2', 'fnirs_detectors')
@@ -738,30 +967,63 @@ class UIManager:
                 if hasattr(parent, control_name):
                     config.channel_counts[count_key] = getattr(parent, control_name).value()
 
-    def _generate_fnirs_components(self, component_type: str, count: int, sensor_config, row_offset: int, sensor_checkboxes: Dict, parent):
+    def _generate_fnirs_components(self, component_type: str, count: int, sensor_config, layout_row: int, sensor_checkboxes: Dict, parent):
         """Generate fNIRS components (sources or detectors)"""
-        color_idx = 0 if component_type == 'Source' else 1
-        prefix_idx = 0 if component_type == 'Source' else 1
+        component_idx = 0 if component_type == 'Source' else 1
         
-        for i in range(count):
-            row = i // sensor_config.channels_per_row + row_offset
-            col = i % sensor_config.channels_per_row
-            
-            checkbox = QCheckBox(f"{sensor_config.prefix[prefix_idx]}{i+1:02d}")
-            checkbox.setStyleSheet(f"QCheckBox {{ color: {sensor_config.color[color_idx]}; font-weight: bold; }}")
-            checkbox.stateChanged.connect(
-                lambda state, idx=i: parent.update_sensor_channels(component_type, idx, state))
-            
-            parent.fnirsGridLayout.addWidget(checkbox, row, col)
-            sensor_checkboxes[component_type].append(checkbox)
+        self._bind_channel_view(component_type, count, sensor_config.prefix[component_idx],
+                                sensor_config.color[component_idx], sensor_config.channels_per_row,
+                                parent.fnirsGridLayout, layout_row, sensor_checkboxes, parent)
+
+    def _can_reuse_channel_view(self, key: str, sensor_checkboxes: Dict) -> bool:
+        """Check whether the view created for a channel group is still in place"""
+        bound = self._channel_views.get(key)
+        return bound is not None and bound[1] is sensor_checkboxes.get(key)
+
+    def _bind_channel_view(self, key: str, count: int, prefix: str, color: str, columns: int,
+                           layout, layout_row: int, sensor_checkboxes: Dict, parent):
+        """Resize the existing channel view of a group, or create it on first use"""
+        if self._can_reuse_channel_view(key, sensor_checkboxes):
+            view, model = self._channel_views[key]
+            model.reset_channels(count)
+        else:
+            model = ChannelCheckModel(key, count, prefix, color, columns)
+            model.channelStateChanged.connect(parent.update_sensor_channels, Qt.DirectConnection)
+            model.channelsChanged.connect(parent.update_sensor_channels_bulk, Qt.DirectConnection)
+            view = self._create_channel_view(model)
+            layout.addWidget(view, layout_row, 0)
+            self._channel_views[key] = (view, model)
+            sensor_checkboxes[key] = model
+        
+        self._fit_channel_view(view, model)
+
+    def _create_channel_view(self, model: ChannelCheckModel) -> QtWidgets.QTableView:
+        """Create a table view for a channel check model"""
+        view = QtWidgets.QTableView()
+        view.setModel(model)
+        view.setShowGrid(False)
+        view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        view.setFocusPolicy(Qt.NoFocus)
+        view.horizontalHeader().hide()
+        view.verticalHeader().hide()
+        view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        view.verticalHeader().setDefaultSectionSize(UIConstants.CHANNEL_ROW_HEIGHT)
+        return view
+
+    def _fit_channel_view(self, view: QtWidgets.QTableView, model: ChannelCheckModel):
+        """Size a channel view to its row count, up to the visible row limit"""
+        visible_rows = min(model.rowCount(), UIConstants.CHANNEL_VIEW_MAX_ROWS)
+        view.setFixedHeight(visible_rows * UIConstants.CHANNEL_ROW_HEIGHT + 2 * view.frameWidth())
 
     def _clear_layout(self, layout):
         """Clear all widgets from a layout"""
         try:
             while layout.count():
-                child = layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
+                widget = layout.takeAt(0).widget()
+                if widget is not None:
+                    # Detach now so the old widget leaves the form before the new one is added
+                    widget.setParent(None)
+                    widget.deleteLater()
         except Exception as e:
             logger.error(f"Failed to clear layout: {e}")
 
@@ -778,43 +1040,34 @@ class UIManager:
             if sensor_type not in UIConstants.SAMPLING_CONFIG:
                 continue
                 
-            config = UIConstants.SAMPLING_CONFIG[sensor_type]
-            control_name = config['control']
-            valid_rates = config['rates']
-            
-            if not hasattr(self.parent, control_name):
+            rate_codes = UIConstants.SAMPLING_RATE_INDEX[sensor_type]
+            control = self._control_cache.get(sensor_type)
+            if control is None:
                 continue
                 
             try:
-                control = getattr(self.parent, control_name)
                 rate = int(control.currentText())
                 
-                if rate not in valid_rates:
-                    raise ValueError(f"Rate {rate}Hz not in allowed rates {valid_rates}")
+                rate_code = rate_codes.get(rate)
+                if rate_code is None:
+                    raise ValueError(f"Rate {rate}Hz not in allowed rates {tuple(rate_codes)}")
                 
                 updated_sensors.extend([
                     sensor_id_map[sensor_type],
-                    valid_rates.index(rate) + 1
+                    rate_code
                 ])
                 
-                logger.info(f"Updated {sensor_type} {operation_type} to {rate}Hz")
+                logger.debug("Updated %s %s to %dHz", sensor_type, operation_type, rate)
                 
             except (ValueError, AttributeError) as e:
                 raise ValueError(f"Invalid {operation_type} for {sensor_type}: {e}")
-        print(f"sample rate data done: len {len(updated_sensors)}")
         return updated_sensors
 
     def modify_sample_rate(self, config, enabled_sensor_types: Set[str]):
         """Update sampling rates from UI controls"""
-        sampling_controls = [
-            ('eeg', 'eegSamplingCombo'),
-            ('semg', 'semgSamplingCombo'),
-            ('fnirs', 'fnirsSamplingCombo')
-        ]
-        
-        for sensor, control_name in sampling_controls:
-            if sensor in enabled_sensor_types and hasattr(self.parent, control_name):
-                control = getattr(self.parent, control_name)
+        for sensor in enabled_sensor_types:
+            control = self._control_cache.get(sensor)
+            if control is not None:
                 config.sampling_rates[sensor] = int(control.currentText())
 
     def apply_loaded_configuration(self, config_dict: Dict[str, Any], config, enabled_sensor_types: Set[str]):
@@ -840,18 +1093,11 @@ class UIManager:
 
     def _apply_loaded_sampling_rates(self, sampling_rates: Dict[str, int], config, enabled_sensor_types: Set[str]):
         """Apply loaded sampling rates"""
-        sampling_controls = {
-            'eeg': 'eegSamplingCombo',
-            'fnirs': 'fnirsSamplingCombo',
-            'semg': 'semgSamplingCombo'
-        }
-        
         for sensor in enabled_sensor_types:
-            if sensor in sampling_rates and sensor in sampling_controls:
-                control_name = sampling_controls[sensor]
-                if hasattr(self.parent, control_name):
+            if sensor in sampling_rates:
+                control = self._control_cache.get(sensor)
+                if control is not None:
                     try:
-                        control = getattr(self.parent, control_name)
                         control.setCurrentText(str(sampling_rates[sensor]))
                         config.sampling_rates[sensor] = sampling_rates[sensor]
                     except Exception as e:
@@ -894,14 +1140,17 @@ class UIManager:
             logger.info(f"Applying loaded enabled channels: {list(enabled_channels.keys())}")
             
             # 首先直接将数据保存到config中 - 这是关键修复
+            debug = logger.isEnabledFor(logging.DEBUG)
             for key, value in enabled_channels.items():
                 config.enabled_channels[key] = value
-                logger.debug(f"Loaded enabled channels for {key}: {type(value)} with {len(value) if hasattr(value, '__len__') else 'N/A'} items")
+                if debug:
+                    logger.debug("Loaded enabled channels for %s: %s with %s items", key, type(value),
+                                 len(value) if hasattr(value, '__len__') else 'N/A')
             
             # 然后应用到UI（如果checkboxes存在的话）
             for sensor in enabled_sensor_types:
                 if sensor in enabled_channels and hasattr(self.parent, 'sensor_checkboxes') and sensor in self.parent.sensor_checkboxes:
-                    self._apply_sensor_channels_to_ui(sensor, enabled_channels[sensor])
+                    self._apply_channels_to_ui(sensor, enabled_channels[sensor])
             
             # 处理fNIRS特殊组件
             if 'fnirs' in enabled_sensor_types:
@@ -915,7 +1164,7 @@ class UIManager:
                         hasattr(self.parent, 'sensor_checkboxes') and 
                         checkbox_key in self.parent.sensor_checkboxes):
                         channels = enabled_channels[key]
-                        self._apply_fnirs_channels_to_ui(checkbox_key, channels)
+                        self._apply_channels_to_ui(checkbox_key, channels, truthy_list=True)
             
             logger.info(f"Successfully applied loaded enabled channels to config and UI")
             
@@ -923,84 +1172,33 @@ class UIManager:
             logger.error(f"Failed to apply loaded enabled channels: {e}")
             raise
 
-    def _apply_sensor_channels_to_ui(self, sensor: str, sensor_channels: Union[List, Dict, Any]):
-        """Apply sensor channels to UI checkboxes"""
-        try:
-            if not hasattr(self.parent, 'sensor_checkboxes') or sensor not in self.parent.sensor_checkboxes:
-                logger.warning(f"No checkboxes found for sensor {sensor}")
-                return
-            
-            checkboxes = self.parent.sensor_checkboxes[sensor]
-            
-            # Clear all checkboxes first
-            for checkbox in checkboxes:
-                checkbox.setChecked(False)
-            
-            if isinstance(sensor_channels, list):
-                # For list of channel indices
-                for channel_idx in sensor_channels:
-                    if isinstance(channel_idx, int) and 0 <= channel_idx < len(checkboxes):
-                        checkboxes[channel_idx].setChecked(True)
-                        
-            elif isinstance(sensor_channels, dict):
-                # For dictionary format (like channel pairs)
-                for key in sensor_channels.keys():
-                    try:
-                        if isinstance(key, str) and key.isdigit():
-                            channel_idx = int(key) - 1  # Convert to 0-based index
-                            if 0 <= channel_idx < len(checkboxes):
-                                checkboxes[channel_idx].setChecked(True)
-                        elif isinstance(key, int):
-                            if 0 <= key < len(checkboxes):
-                                checkboxes[key].setChecked(True)
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to apply channel {key} for {sensor}: {e}")
-                        
-            logger.debug(f"Applied {sensor} channels to UI checkboxes")
-                        
-        except Exception as e:
-            logger.error(f"Failed to apply {sensor} channels to UI: {e}")
+    def _apply_channels_to_ui(self, key: str, channels: Union[List, Dict, Any], truthy_list: bool = False):
+        """Apply loaded channels to the channel model under key
 
-    def _apply_fnirs_channels_to_ui(self, checkbox_key: str, channels):
-        """Apply fNIRS channels to UI checkboxes"""
+        With truthy_list, a list/tuple holds per-channel enable flags (fNIRS
+        source/detector format) instead of channel indices.
+        """
         try:
-            if not hasattr(self.parent, 'sensor_checkboxes') or checkbox_key not in self.parent.sensor_checkboxes:
-                logger.warning(f"No checkboxes found for {checkbox_key}")
+            if not hasattr(self.parent, 'sensor_checkboxes') or key not in self.parent.sensor_checkboxes:
+                logger.warning(f"No checkboxes found for {key}")
                 return
             
-            checkboxes = self.parent.sensor_checkboxes[checkbox_key]
-            
-            # Clear all first
-            for checkbox in checkboxes:
-                checkbox.setChecked(False)
+            if truthy_list and isinstance(channels, (list, tuple)):
+                checked = [i for i, should_enable in enumerate(channels) if should_enable]
+            else:
+                checked = _to_index_set(channels)
             
-            # Apply channels
-            if isinstance(channels, (list, tuple)):
-                for i, should_enable in enumerate(channels):
-                    if i < len(checkboxes) and should_enable:
-                        checkboxes[i].setChecked(True)
-            elif isinstance(channels, dict):
-                for key in channels.keys():
-                    try:
-                        if isinstance(key, str) and key.isdigit():
-                            idx = int(key) - 1
-                            if 0 <= idx < len(checkboxes):
-                                checkboxes[idx].setChecked(True)
-                    except (ValueError, IndexError):
-                        continue
-                        
-            logger.debug(f"Applied {checkbox_key} channels to UI")
+            self.parent.sensor_checkboxes[key].set_checked_indices(checked, bulk=True)
+            logger.debug("Applied %s channels to UI", key)
             
         except Exception as e:
-            logger.error(f"Failed to apply {checkbox_key} channels to UI: {e}")
+            logger.error(f"Failed to apply {key} channels to UI: {e}")
 
     def _apply_sensor_channels(self, sensor: str, sensor_channels: List[int]):
         """Apply enabled channels for a specific sensor"""
         if isinstance(sensor_channels, list):
-            checkboxes = self.parent.sensor_checkboxes[sensor]
-            for i in range(len(sensor_channels)):
-                if i < len(checkboxes):
-                    checkboxes[i].setChecked(True)
+            model = self.parent.sensor_checkboxes[sensor]
+            model.set_checked_indices(model.checked_indices() + list(range(len(sensor_channels))), bulk=True)
 
     def _apply_loaded_electrode_positions(self, enabled_channels: Dict[str, Any]):
         """Apply loaded electrode positions to the locator"""
@@ -1026,6 +1224,7 @@ class UIManager:
         for sensor, layout_name in layout_mappings.items():
             if hasattr(self.parent, layout_name):
                 self._clear_layout(getattr(self.parent, layout_name))
+        self._channel_views.clear()
         
         # Clear checkbox references
         for sensor_type in sensor_checkboxes:
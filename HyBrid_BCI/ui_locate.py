@@ -2,14 +2,22 @@
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 import logging
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional, Mapping, NamedTuple
 from enum import Enum
 import math
-from dataclasses import dataclass
+from functools import lru_cache
+from sys import intern
+from types import MappingProxyType
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+def _frozen_positions(positions: Dict[str, tuple]) -> Mapping[str, tuple]:
+    """Read-only view of a position table with interned electrode names"""
+    return MappingProxyType({intern(name): pos for name, pos in positions.items()})
+
+
 class ElectrodeType(Enum):
     """电极类型枚举"""
     DEFAULT = "default"
@@ -25,9 +33,20 @@ class ElectrodeSize(Enum):
     NORMAL = "normal"
     SMALL = "small"
 
-@dataclass
-class Position3D:
-    """3D position with validation."""
+def pairwise_distances(coords_a, coords_b) -> np.ndarray:
+    """Euclidean distances between two sets of 3D points, shape (len(a), len(b)).
+
+    Uses ||a||² + ||b||² - 2·a·bᵀ so the cross term is one matrix product.
+    """
+    a = np.asarray(coords_a, dtype=np.float64).reshape(-1, 3)
+    b = np.asarray(coords_b, dtype=np.float64).reshape(-1, 3)
+    sq = (a * a).sum(axis=1)[:, None] + (b * b).sum(axis=1)[None, :] - 2.0 * (a @ b.T)
+    np.maximum(sq, 0.0, out=sq)
+    return np.sqrt(sq, out=sq)
+
+
+class Position3D(NamedTuple):
+    """Immutable tuple-backed 3D position."""
     x: float
     y: float
     z: float
@@ -39,17 +58,17 @@ class Position3D:
             (self.y - other.y)**2 + 
             (self.z - other.z)**2
         )
-        logger.debug(f"3D Distance from {self} to {other}: {distance:.2f}")
+        logger.debug("3D Distance from %s to %s: %.2f", self, other, distance)
         return distance
     
     def to_tuple(self) -> Tuple[float, float, float]:
         """Convert to tuple format."""
-        return (self.x, self.y, self.z)
+        return tuple(self)
     
     @classmethod
     def from_tuple(cls, position: Tuple[float, float, float]) -> 'Position3D':
         """Create Position3D from tuple."""
-        return cls(position[0], position[1], position[2])
+        return cls._make(position)
     
     
 class StyleConfig:
@@ -57,10 +76,11 @@ class StyleConfig:
     
     @staticmethod
     def _get_base_style(border_color: str, bg_color: str, text_color: str, 
-                       border_radius: int, border_opacity: float = 1.0) -> str:
+                       border_radius: int, border_opacity: float = 1.0,
+                       selector: str = "QPushButton") -> str:
         """基础样式模板"""
         return f"""
-            QPushButton {{
+            {selector} {{
                 border: 2px solid rgba({border_color}, {border_opacity});
                 border-radius: {border_radius}px;
                 background-color: {bg_color};
@@ -71,112 +91,139 @@ class StyleConfig:
                 max-width: 40px;
                 max-height: 40px;
             }}
-            QPushButton:hover {{
+            {selector}:hover {{
                 background-color: rgba(200, 200, 200, 0.3);
             }}
         """
     
-    @staticmethod
-    def get_head_style() -> str:
-        """头部圆圈样式"""
-        return """
-            QLabel {
-                border: 2px solid rgba(0, 0, 0, 0);
-                border-radius: 240px;
-                background-color: white;
-                color: gray;
-                font: bold 12px;
-                min-width: 10px;
-                min-height: 10px;
-                max-width: 500px;
-                max-height: 500px;
-            }
-        """
+    # 头部圆圈位图缓存（按尺寸），由所有 Ui_Locate 实例共享
+    _HEAD_PIXMAPS: Dict[int, QtGui.QPixmap] = {}
+    
+    # 电极类型 -> (边框颜色, 背景颜色, 文字颜色, 边框透明度)
+    _STYLE_CONFIGS = {
+        ElectrodeType.DEFAULT: ("0, 0, 0", "transparent", "gray", 1.0),
+        ElectrodeType.MIDDLE: ("0, 0, 0", "transparent", "gray", 0.65),
+        ElectrodeType.CENTER: ("0, 0, 0", "transparent", "gray", 0.05),
+        ElectrodeType.SOURCE: ("255, 0, 0", "rgba(255, 0, 0, 0.3)", "red", 1.0),
+        ElectrodeType.DETECTOR: ("0, 0, 255", "rgba(0, 0, 255, 0.3)", "blue", 1.0),
+        ElectrodeType.EEG: ("0, 255, 0", "rgba(0, 255, 0, 0.3)", "green", 1.0),
+    }
     
     @classmethod
-    def get_electrode_style(cls, electrode_type: ElectrodeType, size: ElectrodeSize) -> str:
-        """获取电极样式"""
+    def get_head_pixmap(cls, size: int) -> QtGui.QPixmap:
+        """头部圆圈位图（预先绘制一次，避免每次重绘都光栅化大圆角边框）"""
+        pixmap = cls._HEAD_PIXMAPS.get(size)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(size, size)
+            pixmap.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QtCore.Qt.white)
+            painter.drawEllipse(0, 0, size, size)
+            painter.end()
+            cls._HEAD_PIXMAPS[size] = pixmap
+        return pixmap
+    
+    @classmethod
+    def _style_args(cls, electrode_type: ElectrodeType, size: ElectrodeSize) -> tuple:
+        """(边框颜色, 背景颜色, 文字颜色, 圆角半径, 边框透明度)"""
         radius = 11 if size == ElectrodeSize.SMALL else 13
         
-        style_configs = {
-            ElectrodeType.DEFAULT: ("0, 0, 0", "transparent", "gray", radius, 1.0),
-            ElectrodeType.MIDDLE: ("0, 0, 0", "transparent", "gray", radius, 0.65),
-            ElectrodeType.CENTER: ("0, 0, 0", "transparent", "gray", radius, 0.05),
-            ElectrodeType.SOURCE: ("255, 0, 0", "rgba(255, 0, 0, 0.3)", "red", radius, 1.0),
-            ElectrodeType.DETECTOR: ("0, 0, 255", "rgba(0, 0, 255, 0.3)", "blue", radius, 1.0),
-            ElectrodeType.EEG: ("0, 255, 0", "rgba(0, 255, 0, 0.3)", "green", radius, 1.0),
-        }
-        
-        config = style_configs.get(electrode_type, style_configs[ElectrodeType.DEFAULT])
-        return cls._get_base_style(*config)
+        border_color, bg_color, text_color, border_opacity = cls._STYLE_CONFIGS.get(
+            electrode_type, cls._STYLE_CONFIGS[ElectrodeType.DEFAULT])
+        return border_color, bg_color, text_color, radius, border_opacity
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_electrode_style(cls, electrode_type: ElectrodeType, size: ElectrodeSize) -> str:
+        """获取电极样式（按类型和大小缓存）"""
+        return cls._get_base_style(*cls._style_args(electrode_type, size))
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_form_style_sheet(cls) -> str:
+        """表单级样式表：所有电极类型/大小的样式合并一次，按按钮的动态属性选择"""
+        return "".join(
+            cls._get_base_style(
+                *cls._style_args(etype, esize),
+                selector=f'QPushButton[electrodeType="{etype.value}"][electrodeSize="{esize.value}"]')
+            for etype in ElectrodeType for esize in ElectrodeSize
+        )
 
 
 class ElectrodePositions:
     """电极位置管理类"""
     
-    @staticmethod
-    def get_base_positions() -> Dict[str, Tuple[int, int]]:
-        """基础电极位置"""
-        return {
-            # Left hemisphere electrodes
-            'AF7': (134,  67),                    'AF3': (200,  82), 'Fp1': (199,  39), 
-             'F7': ( 76, 121),  'F5': (114, 132),  'F3': (164, 141),  'F1': (214, 146),
-            'FT7': ( 39, 196), 'FC5': ( 94, 200), 'FC3': (149, 204), 'FC1': (209, 206),
-             'T7': ( 27, 267),  'C5': ( 87, 267),  'C3': (147, 267),  'C1': (207, 267),
-            'TP7': ( 40, 340), 'CP5': ( 94, 334), 'CP3': (149, 330), 'CP1': (209, 328),
-             'P7': ( 76, 413),  'P5': (114, 402),  'P3': (164, 393),  'P1': (214, 388),
-            'PO7': (134, 467),                    'PO3': (200, 452),  'O1': (199, 496),
-            
-            # Midline electrodes
-            'Fpz': (267,  27), 'AFz': (267,  87),  'Fz': (267, 147),
-            'FCz': (267, 207),  'Cz': (267, 267), 'CPz': (267, 327),
-             'Pz': (267, 387), 'POz': (267, 447),  'Oz': (267, 507),
-            
-            # Right hemisphere electrodes
-            'AF8': (400,  67),                    'AF4': (334,  82), 'Fp2': (335,  39),
-             'F8': (458, 121),  'F6': (420, 132),  'F4': (370, 141),  'F2': (320, 146),
-            'FT8': (495, 196), 'FC6': (440, 200), 'FC4': (385, 204), 'FC2': (325, 206),
-             'T8': (507, 267),  'C6': (447, 267),  'C4': (387, 267),  'C2': (327, 267),
-            'TP8': (495, 340), 'CP6': (440, 334), 'CP4': (385, 330), 'CP2': (325, 328),
-             'P8': (458, 413),  'P6': (420, 402),  'P4': (370, 393),  'P2': (320, 388),
-            'PO8': (400, 467),                    'PO4': (334, 452),  'O2': (335, 496),
-        }
+    # 基础电极位置
+    _BASE_POSITIONS: Mapping[str, Tuple[int, int]] = _frozen_positions({
+        # Left hemisphere electrodes
+        'AF7': (134,  67),                    'AF3': (200,  82), 'Fp1': (199,  39), 
+         'F7': ( 76, 121),  'F5': (114, 132),  'F3': (164, 141),  'F1': (214, 146),
+        'FT7': ( 39, 196), 'FC5': ( 94, 200), 'FC3': (149, 204), 'FC1': (209, 206),
+         'T7': ( 27, 267),  'C5': ( 87, 267),  'C3': (147, 267),  'C1': (207, 267),
+        'TP7': ( 40, 340), 'CP5': ( 94, 334), 'CP3': (149, 330), 'CP1': (209, 328),
+         'P7': ( 76, 413),  'P5': (114, 402),  'P3': (164, 393),  'P1': (214, 388),
+        'PO7': (134, 467),                    'PO3': (200, 452),  'O1': (199, 496),
+        
+        # Midline electrodes
+        'Fpz': (267,  27), 'AFz': (267,  87),  'Fz': (267, 147),
+        'FCz': (267, 207),  'Cz': (267, 267), 'CPz': (267, 327),
+         'Pz': (267, 387), 'POz': (267, 447),  'Oz': (267, 507),
+        
+        # Right hemisphere electrodes
+        'AF8': (400,  67),                    'AF4': (334,  82), 'Fp2': (335,  39),
+         'F8': (458, 121),  'F6': (420, 132),  'F4': (370, 141),  'F2': (320, 146),
+        'FT8': (495, 196), 'FC6': (440, 200), 'FC4': (385, 204), 'FC2': (325, 206),
+         'T8': (507, 267),  'C6': (447, 267),  'C4': (387, 267),  'C2': (327, 267),
+        'TP8': (495, 340), 'CP6': (440, 334), 'CP4': (385, 330), 'CP2': (325, 328),
+         'P8': (458, 413),  'P6': (420, 402),  'P4': (370, 393),  'P2': (320, 388),
+        'PO8': (400, 467),                    'PO4': (334, 452),  'O2': (335, 496),
+    })
+    
+    # 3D电极位置
+    _POSITIONS_3D: Mapping[str, Tuple[int, int, int]] = _frozen_positions({
+        # Left hemisphere electrodes
+        'AF7': (-51,  71, -3),                        'AF3': (-36,  76, 24), 'Fp1': (-27,  83, -3), 
+         'F7': (-71,  51, -3),  'F5': (-64,  55, 23),  'F3': (-48,  59, 44),  'F1': (-25,  62, 56),
+        'FT7': (-83,  27, -3), 'FC5': (-78,  30, 27), 'FC3': (-59,  31, 56), 'FC1': (-33,  33, 74),
+         'T7': (-87,   0, -3),  'C5': (-82,   0, 31),  'C3': (-63,   0, 61),  'C1': (-34,   0, 81),
+        'TP7': (-83, -27, -3), 'CP5': (-78, -30, 27), 'CP3': (-59, -31, 56), 'CP1': (-33, -33, 74),
+         'P7': (-71, -51, -3),  'P5': (-64, -55, 23),  'P3': (-48, -59, 44),  'P1': (-25, -62, 56),
+        'PO7': (-51, -71, -3),                        'PO3': (-36, -76, 24),  'O1': (-27, -83, -3),
+        
+        # Midline electrodes
+        'Fpz': (  0,  87, -3), 'AFz': (  0,  82, 31),  'Fz': (  0,  63, 61),
+        'FCz': (  0,  34, 81),  'Cz': (  0,   0, 88), 'CPz': (  0, -34, 81),
+         'Pz': (  0, -63, 61), 'POz': (  0, -82, 31),  'Oz': (  0, -87, -3),
+        
+        # Right hemisphere electrodes
+        'AF8':  (51,  71, -3),                        'AF4': ( 36,  76, 24), 'Fp2': ( 27,  83, -3), 
+         'F8':  (71,  51, -3),  'F6': ( 64,  55, 23),  'F4': ( 48,  59, 44),  'F2': ( 25,  62, 56),
+        'FT8':  (83,  27, -3), 'FC6': ( 78,  30, 27), 'FC4': ( 59,  31, 56), 'FC2': ( 33,  33, 74),
+         'T8':  (87,   0, -3),  'C6': ( 82,   0, 31),  'C4': ( 63,   0, 61),  'C2': ( 34,   0, 81),
+        'TP8':  (83, -27, -3), 'CP6': ( 78, -30, 27), 'CP4': ( 59, -31, 56), 'CP2': ( 33, -33, 74),
+         'P8':  (71, -51, -3),  'P6': ( 64, -55, 23),  'P4': ( 48, -59, 44),  'P2': ( 25, -62, 56),
+        'PO8':  (51, -71, -3),                        'PO4': ( 36, -76, 24),  'O2': ( 27, -83, -3),
+        
+        # Additional electrodes
+        'P10': (64, -47, -37),  'P9':(-64, -47, -37),  'Iz':  (0, -79, -37),
+    })
     
-    @staticmethod
-    def get_3d_positions() -> Dict[str, Tuple[int, int, int]]:
-        """3D电极位置"""
-        return {
-            # Left hemisphere electrodes
-            'AF7': (-51,  71, -3),                        'AF3': (-36,  76, 24), 'Fp1': (-27,  83, -3), 
-             'F7': (-71,  51, -3),  'F5': (-64,  55, 23),  'F3': (-48,  59, 44),  'F1': (-25,  62, 56),
-            'FT7': (-83,  27, -3), 'FC5': (-78,  30, 27), 'FC3': (-59,  31, 56), 'FC1': (-33,  33, 74),
-             'T7': (-87,   0, -3),  'C5': (-82,   0, 31),  'C3': (-63,   0, 61),  'C1': (-34,   0, 81),
-            'TP7': (-83, -27, -3), 'CP5': (-78, -30, 27), 'CP3': (-59, -31, 56), 'CP1': (-33, -33, 74),
-             'P7': (-71, -51, -3),  'P5': (-64, -55, 23),  'P3': (-48, -59, 44),  'P1': (-25, -62, 56),
-            'PO7': (-51, -71, -3),                        'PO3': (-36, -76, 24),  'O1': (-27, -83, -3),
-            
-            # Midline electrodes
-            'Fpz': (  0,  87, -3), 'AFz': (  0,  82, 31),  'Fz': (  0,  63, 61),
-            'FCz': (  0,  34, 81),  'Cz': (  0,   0, 88), 'CPz': (  0, -34, 81),
-             'Pz': (  0, -63, 61), 'POz': (  0, -82, 31),  'Oz': (  0, -87, -3),
-            
-            # Right hemisphere electrodes
-            'AF8':  (51,  71, -3),                        'AF4': ( 36,  76, 24), 'Fp2': ( 27,  83, -3), 
-             'F8':  (71,  51, -3),  'F6': ( 64,  55, 23),  'F4': ( 48,  59, 44),  'F2': ( 25,  62, 56),
-            'FT8':  (83,  27, -3), 'FC6': ( 78,  30, 27), 'FC4': ( 59,  31, 56), 'FC2': ( 33,  33, 74),
-             'T8':  (87,   0, -3),  'C6': ( 82,   0, 31),  'C4': ( 63,   0, 61),  'C2': ( 34,   0, 81),
-            'TP8':  (83, -27, -3), 'CP6': ( 78, -30, 27), 'CP4': ( 59, -31, 56), 'CP2': ( 33, -33, 74),
-             'P8':  (71, -51, -3),  'P6': ( 64, -55, 23),  'P4': ( 48, -59, 44),  'P2': ( 25, -62, 56),
-            'PO8':  (51, -71, -3),                        'PO4': ( 36, -76, 24),  'O2': ( 27, -83, -3),
-            
-            # Additional electrodes
-            'P10': (64, -47, -37),  'P9':(-64, -47, -37),  'Iz':  (0, -79, -37),
-        }
+    @classmethod
+    def get_base_positions(cls) -> Mapping[str, Tuple[int, int]]:
+        """基础电极位置（只读）"""
+        return cls._BASE_POSITIONS
+    
+    @classmethod
+    def get_3d_positions(cls) -> Mapping[str, Tuple[int, int, int]]:
+        """3D电极位置（只读）"""
+        return cls._POSITIONS_3D
     
     @classmethod
     def get_midpoint(cls, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> Tuple[int, int]:
         """计算两点中点"""
-        return ((pos1[0] + pos2[0]) // 2, (pos1[1] + pos2[1]) // 2)
+        return ((pos1[0] + pos2[0]) >> 1, (pos1[1] + pos2[1]) >> 1)
     
     @classmethod
     def get_center_point(cls, positions: List[Tuple[int, int]]) -> Tuple[int, int]:
@@ -189,11 +236,53 @@ class ElectrodePositions:
 class ElectrodeCalculator:
     """电极位置计算器"""
     
-    def __init__(self, base_positions: Dict[str, Tuple[int, int]], node_names: List[str]):
+    # 特殊区域中心点：(组成电极, 名称)
+    _SPECIAL_GROUPS = (
+        (["Fp1", "Fpz", "AF3", "AFz"], "Fp1_Fpz_AF3_AFz"),
+        (["Fpz", "Fp2", "AFz", "AF4"], "Fpz_Fp2_AFz_AF4"),
+        (["O1", "Oz", "PO3", "POz"], "O1_Oz_PO3_POz"),
+        (["Oz", "O2", "POz", "PO4"], "Oz_O2_POz_PO4"),
+        (["AF3", "AFz", "F1", "Fz"], "AF3_AFz_F1_Fz"),
+        (["AFz", "AF4", "Fz", "F2"], "AFz_AF4_Fz_F2"),
+        (["P1", "Pz", "PO3", "POz"], "P1_Pz_PO3_POz"),
+        (["Pz", "P2", "POz", "PO4"], "Pz_P2_POz_PO4"),
+        (["AF7", "AF3", "F7", "F5"], "AF7_AF3_F7_F5"),
+        (["AF4", "AF8", "F6", "F8"], "AF4_AF8_F6_F8"),
+        (["P7", "P5", "PO7", "PO3"], "P7_P5_PO7_PO3"),
+        (["P6", "P8", "PO4", "PO8"], "P6_P8_PO4_PO8"),
+        (["AF7", "AF3", "F5", "F3"], "AF7_AF3_F5_F3"),
+        (["AF4", "AF8", "F4", "F6"], "AF4_AF8_F4_F6"),
+        (["P5", "P3", "PO3", "PO7"], "P5_P3_PO3_PO7"),
+        (["P4", "P6", "PO4", "PO8"], "P4_P6_PO4_PO8"),
+    )
+    
+    # 每列从前到后的节点顺序：7/8 列走颞区 (FT/T/TP)，1/2 列在 AF、PO 处借用 3/4 列节点，
+    # 3/4 列不含 AF/PO
+    _COLUMN_TEMPLATES = {
+        '7': ("AF7", "F7", "FT7", "T7", "TP7", "P7", "PO7"),
+        '5': ("F5", "FC5", "C5", "CP5", "P5"),
+        '3': ("F3", "FC3", "C3", "CP3", "P3"),
+        '1': ("Fp1", "AF3", "F1", "FC1", "C1", "CP1", "P1", "PO3", "O1"),
+        'z': ("Fpz", "AFz", "Fz", "FCz", "Cz", "CPz", "Pz", "POz", "Oz"),
+        '2': ("Fp2", "AF4", "F2", "FC2", "C2", "CP2", "P2", "PO4", "O2"),
+        '4': ("F4", "FC4", "C4", "CP4", "P4"),
+        '6': ("F6", "FC6", "C6", "CP6", "P6"),
+        '8': ("AF8", "F8", "FT8", "T8", "TP8", "P8", "PO8"),
+    }
+    
+    def __init__(self, base_positions: Mapping[str, Tuple[int, int]], node_names: Tuple[str, ...]):
         self.base_positions = base_positions
         self.node_names = node_names
+        self.node_set = frozenset(node_names)
+        # SoA布局：名称 -> 行号，坐标为 (N, 2) int32 数组
+        self._index = {name: i for i, name in enumerate(base_positions)}
+        self._xy = np.array(list(base_positions.values()), dtype=np.int32).reshape(-1, 2)
         self.former = ["Fp", "AF", "F", "FC", "C", "CP", "P", "PO", "O"]
         self.latter = ["7", "5", "3", "1", "z", "2", "4", "6", "8"]
+        
+        # 行/列的有效节点表，只计算一次
+        self._row_nodes = {prefix: self._get_valid_nodes_for_row(prefix) for prefix in self.former}
+        self._column_nodes = {suffix: self._get_valid_nodes_for_column(suffix) for suffix in self.latter}
     
     def _get_adjusted_prefix(self, prefix: str, suffix: str) -> str:
         """根据后缀调整前缀"""
@@ -208,64 +297,58 @@ class ElectrodeCalculator:
         for suffix in self.latter:
             adjusted_prefix = self._get_adjusted_prefix(prefix, suffix)
             node = adjusted_prefix + suffix
-            if node in self.node_names:
+            if node in self.node_set:
                 valid_nodes.append(node)
         return valid_nodes
     
     def _get_valid_nodes_for_column(self, suffix: str) -> List[str]:
         """获取列的有效节点"""
-        if suffix in ['7', '8']:
-            current_former = ["Fp", "AF", "F", "FT", "T", "TP", "P", "PO", "O"]
-        else:
-            current_former = self.former.copy()
-        
-        valid_nodes = []
-        for prefix in current_former:
-            node_name = prefix + suffix
-            if node_name in self.node_names:
-                valid_nodes.append(node_name)
-        
-        # 特殊处理
-        if suffix == '1':
-            valid_nodes.insert(1, "AF3")
-            valid_nodes.insert(7, "PO3")
-        elif suffix == '2':
-            valid_nodes.insert(1, "AF4")
-            valid_nodes.insert(7, "PO4")
-        elif suffix in ["3", "4"]:
-            if valid_nodes:
-                valid_nodes = valid_nodes[1:-1]  # 去掉首尾
-        
-        return valid_nodes
-    
-    def _add_middle_nodes(self, valid_nodes: List[str]) -> Dict[str, Tuple[int, int]]:
-        """添加相邻节点的中点"""
-        middle_positions = {}
-        for i in range(len(valid_nodes) - 1):
-            node1, node2 = valid_nodes[i], valid_nodes[i + 1]
-            pos1, pos2 = self.base_positions[node1], self.base_positions[node2]
-            middle_positions[f'{node1}_{node2}'] = ElectrodePositions.get_midpoint(pos1, pos2)
-        return middle_positions
+        return [node for node in self._COLUMN_TEMPLATES[suffix] if node in self.node_set]
+    
+    def _midpoints(self, pairs: List[Tuple[str, str]]) -> Dict[str, Tuple[int, int]]:
+        """批量计算相邻节点对的中点"""
+        if not pairs:
+            return {}
+        i = np.fromiter((self._index[a] for a, _ in pairs), dtype=np.intp, count=len(pairs))
+        j = np.fromiter((self._index[b] for _, b in pairs), dtype=np.intp, count=len(pairs))
+        mid = (self._xy[i] + self._xy[j]) >> 1
+        return {f'{a}_{b}': (x, y) for (a, b), (x, y) in zip(pairs, mid.tolist())}
+    
+    def _centers(self, groups: List[Tuple[List[str], str]]) -> Dict[str, Tuple[int, int]]:
+        """批量计算节点组的中心点（忽略不存在的节点）"""
+        idx = np.zeros((len(groups), 4), dtype=np.intp)
+        mask = np.zeros((len(groups), 4), dtype=bool)
+        for g, (nodes, _) in enumerate(groups):
+            for k, node in enumerate(nodes):
+                row = self._index.get(node)
+                if row is not None:
+                    idx[g, k] = row
+                    mask[g, k] = True
+        
+        counts = mask.sum(axis=1)
+        sums = (self._xy[idx] * mask[..., None]).sum(axis=1)
+        valid = counts > 0
+        centers = sums[valid] // counts[valid, None]
+        names = [name for (_, name), ok in zip(groups, valid.tolist()) if ok]
+        return {name: (x, y) for name, (x, y) in zip(names, centers.tolist())}
     
     def calculate_mid_positions(self) -> Dict[str, Tuple[int, int]]:
         """计算中间电极位置"""
-        middle_positions = {}
+        pairs = []
         
         # 水平中点（按行处理）
-        for prefix in self.former:
-            valid_nodes = self._get_valid_nodes_for_row(prefix)
-            middle_positions.update(self._add_middle_nodes(valid_nodes))
+        for valid_nodes in self._row_nodes.values():
+            pairs.extend(zip(valid_nodes, valid_nodes[1:]))
         
         # 垂直处理
-        for suffix in self.latter:
-            valid_nodes = self._get_valid_nodes_for_column(suffix)
-            middle_positions.update(self._add_middle_nodes(valid_nodes))
+        for valid_nodes in self._column_nodes.values():
+            pairs.extend(zip(valid_nodes, valid_nodes[1:]))
         
-        return middle_positions
+        return self._midpoints(pairs)
     
     def calculate_center_positions(self) -> Dict[str, Tuple[int, int]]:
         """计算中心电极位置"""
-        center_positions = {}
+        groups = []
         
         # 主网格中心点
         for j in range(len(self.latter) - 1):
@@ -282,37 +365,20 @@ class ElectrodeCalculator:
                     current_former2[i] + b2,
                     current_former2[i + 1] + b2
                 ]
-                node_name = "_".join(nodes)
-                positions = [self.base_positions[node] for node in nodes if node in self.base_positions]
-                if positions:
-                    center_positions[node_name] = ElectrodePositions.get_center_point(positions)
+                groups.append((nodes, "_".join(nodes)))
         
         # 特殊区域中心点
-        special_groups = [
-            (["Fp1", "Fpz", "AF3", "AFz"], "Fp1_Fpz_AF3_AFz"),
-            (["Fpz", "Fp2", "AFz", "AF4"], "Fpz_Fp2_AFz_AF4"),
-            (["O1", "Oz", "PO3", "POz"], "O1_Oz_PO3_POz"),
-            (["Oz", "O2", "POz", "PO4"], "Oz_O2_POz_PO4"),
-            (["AF3", "AFz", "F1", "Fz"], "AF3_AFz_F1_Fz"),
-            (["AFz", "AF4", "Fz", "F2"], "AFz_AF4_Fz_F2"),
-            (["P1", "Pz", "PO3", "POz"], "P1_Pz_PO3_POz"),
-            (["Pz", "P2", "POz", "PO4"], "Pz_P2_POz_PO4"),
-            (["AF7", "AF3", "F7", "F5"], "AF7_AF3_F7_F5"),
-            (["AF4", "AF8", "F6", "F8"], "AF4_AF8_F6_F8"),
-            (["P7", "P5", "PO7", "PO3"], "P7_P5_PO7_PO3"),
-            (["P6", "P8", "PO4", "PO8"], "P6_P8_PO4_PO8"),
-            (["AF7", "AF3", "F5", "F3"], "AF7_AF3_F5_F3"),
-            (["AF4", "AF8", "F4", "F6"], "AF4_AF8_F4_F6"),
-            (["P5", "P3", "PO3", "PO7"], "P5_P3_PO3_PO7"),
-            (["P4", "P6", "PO4", "PO8"], "P4_P6_PO4_PO8"),
-        ]
-        
-        for nodes, name in special_groups:
-            positions = [self.base_positions[node] for node in nodes if node in self.base_positions]
-            if positions:
-                center_positions[name] = ElectrodePositions.get_center_point(positions)
+        groups.extend(self._SPECIAL_GROUPS)
         
-        return center_positions
+        return self._centers(groups)
+
+
+# 中间/中心电极位置只依赖固定的基础位置，导入时计算一次
+_BASE_CALCULATOR = ElectrodeCalculator(ElectrodePositions.get_base_positions(),
+                                       tuple(ElectrodePositions.get_base_positions()))
+_MID_POSITIONS = _frozen_positions(_BASE_CALCULATOR.calculate_mid_positions())
+_CENTER_POSITIONS = _frozen_positions(_BASE_CALCULATOR.calculate_center_positions())
+del _BASE_CALCULATOR
 
 
 class PositionManager:
@@ -323,18 +389,34 @@ class PositionManager:
         self._base_positions = self.electrode_positions.get_base_positions()
         self._base_3d_positions = self.electrode_positions.get_3d_positions()
         
-        #计算所有类型的电极位置
-        node_names = list(self._base_positions.keys())
-        calculator = ElectrodeCalculator(self._base_positions, node_names)
-        
-        self._mid_positions = calculator.calculate_mid_positions()
-        self._center_positions = calculator.calculate_center_positions()
-        
-        #合并所有2D位置
-        self.all_2d_positions = {}
-        self.all_2d_positions.update(self._base_positions)
-        self.all_2d_positions.update(self._mid_positions)
-        self.all_2d_positions.update(self._center_positions)
+        #所有类型的电极位置（中间/中心位置已在导入时算好）
+        self._base_electrode_names = tuple(self._base_positions)
+        self._mid_positions = _MID_POSITIONS
+        self._center_positions = _CENTER_POSITIONS
+        self._mid_electrode_names = tuple(self._mid_positions)
+        self._center_electrode_names = tuple(self._center_positions)
+        
+        #合并所有2D位置（只读）
+        self.all_2d_positions = MappingProxyType({**self._base_positions,
+                                                  **self._mid_positions,
+                                                  **self._center_positions})
+        self._all_electrode_names = tuple(self.all_2d_positions)
+        
+        #所有电极的3D坐标矩阵 (N, 3)：先是基础电极，再是复合电极（各组成电极的质心），
+        #位置固定，初始化时一次算好，用于批量距离计算
+        base_index = {name: i for i, name in enumerate(self._base_3d_positions)}
+        base_coords = np.asarray(list(self._base_3d_positions.values()), dtype=np.float64)
+        composite_names, composite_coords = [], []
+        for name in self.all_2d_positions:
+            if '_' not in name:
+                continue
+            idx = np.fromiter((base_index[c] for c in name.split('_') if c in base_index), dtype=np.intp)
+            if len(idx):
+                composite_names.append(name)
+                composite_coords.append(base_coords[idx].mean(axis=0))
+        
+        self._node_index = {name: i for i, name in enumerate(list(base_index) + composite_names)}
+        self._coords3d = np.vstack([base_coords] + composite_coords) if composite_coords else base_coords
         
         logger.info(f"PositionManager initialized with {len(self.all_2d_positions)} 2D positions "
                    f"and {len(self._base_3d_positions)} 3D positions")
@@ -342,14 +424,14 @@ class PositionManager:
     def get_2d_positio(self, node_name: str) -> Optional[Tuple[int,int]]:
         position = self.all_2d_positions.get(node_name)
         if position:
-            logger.debug(f"2D Position for {node_name}: {position}")
+            logger.debug("2D Position for %s: %s", node_name, position)
         else:
             logger.warning(f"No 2D position found for node: {node_name}")
         return position
     
     def get_3d_position(self, node: str) -> Optional[Position3D]:
         """Get 3D position with composite node handling."""
-        logger.debug(f"Getting 3D position for node: {node}")
+        logger.debug("Getting 3D position for node: %s", node)
         
         try:
             if '_' in node:
@@ -367,7 +449,11 @@ class PositionManager:
     
     def _get_composite_3d_position(self, composite_node: str) -> Optional[Position3D]:
         """Calculate average position for composite nodes."""
-        logger.debug(f"Calculating composite 3D position for: {composite_node}")
+        idx = self._node_index.get(composite_node)
+        if idx is not None:
+            return Position3D.from_tuple(tuple(self._coords3d[idx].tolist()))
+        
+        logger.debug("Calculating composite 3D position for: %s", composite_node)
         
         components = composite_node.split('_')
         valid_positions = []
@@ -376,7 +462,7 @@ class PositionManager:
             if component in self._base_3d_positions:
                 pos = self._base_3d_positions[component]
                 valid_positions.append(Position3D.from_tuple(pos))
-                logger.debug(f"Added component {component} position: {pos}")
+                logger.debug("Added component %s position: %s", component, pos)
             else:
                 logger.warning(f"Component {component} not found in 3D positions")
         
@@ -390,12 +476,12 @@ class PositionManager:
         avg_z = sum(pos.z for pos in valid_positions) / len(valid_positions)
         
         result = Position3D(avg_x, avg_y, avg_z)
-        logger.debug(f"Composite position for {composite_node}: {result}")
+        logger.debug("Composite position for %s: %s", composite_node, result)
         return result
     
     def calculate_3d_distance(self, node1: str, node2: str) -> float:
         """Calculate 3D distance between two nodes with error handling."""
-        logger.debug(f"Calculating 3D distance between {node1} and {node2}")
+        logger.debug("Calculating 3D distance between %s and %s", node1, node2)
         
         try:
             pos1 = self.get_3d_position(node1)
@@ -406,28 +492,59 @@ class PositionManager:
                 return float('inf')
             
             distance = pos1.distance_to(pos2)
-            logger.debug(f"3D distance {node1}-{node2}: {distance:.2f}mm")
+            logger.debug("3D distance %s-%s: %.2fmm", node1, node2, distance)
             return distance
             
         except Exception as e:
             logger.error(f"Error calculating 3D distance {node1}-{node2}: {e}")
             return float('inf')
 
-    def get_all_electrode_names(self) -> List[str]:
-        """获取所有电极名称"""
-        return list(self.all_2d_positions.keys())
+    def _gather_3d(self, nodes: List[str]) -> np.ndarray:
+        """Stack 3D coordinates of nodes into an (N, 3) array, NaN rows for unknown nodes."""
+        idx = np.fromiter((self._node_index.get(node, -1) for node in nodes), dtype=np.intp, count=len(nodes))
+        coords = self._coords3d[idx]
+        for row in np.flatnonzero(idx < 0).tolist():
+            position = self.get_3d_position(nodes[row])
+            coords[row] = position.to_tuple() if position is not None else np.nan
+        return coords
+    
+    def pairwise_3d_distances(self, nodes_a: List[str], nodes_b: List[str]) -> np.ndarray:
+        """Batch 3D distances between two node lists; inf where a node has no position."""
+        distances = pairwise_distances(self._gather_3d(list(nodes_a)), self._gather_3d(list(nodes_b)))
+        distances[np.isnan(distances)] = np.inf
+        return distances
+    
+    def distance_matrix(self, nodes: List[str]) -> np.ndarray:
+        """Symmetric 3D distance matrix between all given nodes; inf where a node has no position."""
+        coords = self._gather_3d(list(nodes))
+        distances = pairwise_distances(coords, coords)
+        # 对角线清零，消除展开式的舍入误差
+        np.fill_diagonal(distances, 0.0)
+        distances[np.isnan(coords).any(axis=1)] = np.inf
+        distances[:, np.isnan(coords).any(axis=1)] = np.inf
+        return distances
+
+    def get_all_electrode_names(self) -> Tuple[str, ...]:
+        """获取所有电极名称（只读）"""
+        return self._all_electrode_names
     
-    def get_base_electrode_names(self) -> List[str]:
-        """获取基础电极名称"""
-        return list(self._base_positions.keys())
+    def get_base_electrode_names(self) -> Tuple[str, ...]:
+        """获取基础电极名称（只读）"""
+        return self._base_electrode_names
     
-    def get_mid_electrode_names(self) -> List[str]:
-        """获取中间电极名称"""
-        return list(self._mid_positions.keys())
+    def get_mid_electrode_names(self) -> Tuple[str, ...]:
+        """获取中间电极名称（只读）"""
+        return self._mid_electrode_names
     
-    def get_center_electrode_names(self) -> List[str]:
-        """获取中心电极名称"""
-        return list(self._center_positions.keys())
+    def get_center_electrode_names(self) -> Tuple[str, ...]:
+        """获取中心电极名称（只读）"""
+        return self._center_electrode_names
+
+@lru_cache(maxsize=1)
+def _get_position_manager() -> PositionManager:
+    """共享的位置管理器（位置表只读，所有界面复用同一实例）"""
+    return PositionManager()
+
 
 class Ui_Locate(object):
     """UI class for EEG Electrode Interface with improved organization and consistency."""
@@ -439,7 +556,8 @@ class Ui_Locate(object):
     
     def __init__(self):
         self.dynamic_buttons = []
-        self.position_manager = PositionManager()
+        self._buttons: Dict[str, QtWidgets.QPushButton] = {}
+        self.position_manager = _get_position_manager()
         
     def setupUi(self, Form):
         """Setup the main UI components."""
@@ -449,9 +567,16 @@ class Ui_Locate(object):
         Form.resize(564, 580)
         Form.setWindowTitle("EEG Electrode Interface")
         
+        # 电极按钮共用一个表单级样式表，按动态属性选择样式
+        Form.setStyleSheet(StyleConfig.get_form_style_sheet())
+        
         # Create components in logical order
         self._create_head_circle(Form)
-        self._create_electrode_groups(Form)
+        Form.setUpdatesEnabled(False)
+        try:
+            self._create_electrode_groups(Form)
+        finally:
+            Form.setUpdatesEnabled(True)
         
         logger.info("UI setup completed successfully")
     
@@ -460,15 +585,15 @@ class Ui_Locate(object):
         logger.debug("Creating head circle background")
         
         self.headCircle = QtWidgets.QLabel(Form)
-        self.headCircle.setEnabled(False)
+        # Click-through instead of disabled, so the pixmap is not drawn greyed out
+        self.headCircle.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
         self.headCircle.setGeometry(QtCore.QRect(
             self.HEAD_CIRCLE_OFFSET, 
             self.HEAD_CIRCLE_OFFSET, 
             self.HEAD_CIRCLE_SIZE, 
             self.HEAD_CIRCLE_SIZE
         ))
-        self.headCircle.setStyleSheet(StyleConfig.get_head_style())
-        self.headCircle.setText("")
+        self.headCircle.setPixmap(StyleConfig.get_head_pixmap(self.HEAD_CIRCLE_SIZE))
         self.headCircle.setObjectName("headCircle")
         
         logger.debug("Head circle created successfully")
@@ -488,69 +613,66 @@ class Ui_Locate(object):
                                 electrode_type: ElectrodeType, size: ElectrodeSize, 
                                 offset_x: int = 0, offset_y: int = 0):
         """Create electrode buttons from position data."""
-        logger.info(f"Creating {electrode_type.value} electrode buttons")
+        logger.debug("Creating %s electrode buttons", electrode_type.value)
         
         size_adjustment = -4 if size == ElectrodeSize.SMALL else 0
         button_size = self.ELECTRODE_SIZE + size_adjustment
         created_count = 0
         
+        # 只有默认电极显示文本
+        show_text = electrode_type == ElectrodeType.DEFAULT
+        
         for name, (x, y) in positions.items():
-            try:
-                button = QtWidgets.QPushButton(Form)
-                button.setGeometry(QtCore.QRect(
-                    x + offset_x, y + offset_y, button_size, button_size
-                ))
-                button.setStyleSheet(StyleConfig.get_electrode_style(electrode_type, size))
-                
-                # 只有默认电极显示文本
-                if electrode_type == ElectrodeType.DEFAULT:
-                    button.setText(name)
-                
-                button.setObjectName(f"electrode_{name}")
-                setattr(self, f"electrode_{name}", button)
-                created_count += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to create electrode {name}: {e}")
+            button = QtWidgets.QPushButton(Form)
+            button.setGeometry(x + offset_x, y + offset_y, button_size, button_size)
+            button.setProperty("electrodeType", electrode_type.value)
+            button.setProperty("electrodeSize", size.value)
+            if show_text:
+                button.setText(name)
+            self._buttons[name] = button
+            created_count += 1
         
-        logger.info(f"Successfully created {created_count} {electrode_type.value} electrode buttons")
+        logger.info("Successfully created %d %s electrode buttons", created_count, electrode_type.value)
     
     def get_electrode_button(self, electrode_name: str) -> QtWidgets.QPushButton:
         """Get electrode button by name for easy access."""
-        button = getattr(self, f"electrode_{electrode_name}", None)
+        button = self._buttons.get(electrode_name)
         if button is None:
             logger.warning(f"Electrode button '{electrode_name}' not found")
         return button # type: ignore
     
-    def get_default_electrode_names(self) -> List[str]:
+    def get_default_electrode_names(self) -> Tuple[str, ...]:
         """Get list of all electrode names."""
         return self.position_manager.get_base_electrode_names()
     
-    def get_all_electrode_names(self) -> List[str]:
+    def get_all_electrode_names(self) -> Tuple[str, ...]:
         """Get list of all electrode names."""
         return self.position_manager.get_all_electrode_names()
     
     def get_position_manager(self) -> PositionManager:
         """Get the position manager instance."""
         if not hasattr(self, 'position_manager') or self.position_manager is None:
-            logger.warning("Position manager not initialized, creating new instance")
-            self.position_manager = PositionManager()
+            logger.warning("Position manager not initialized, using shared instance")
+            self.position_manager = _get_position_manager()
         return self.position_manager
     
+    _ELECTRODE_TYPES = {etype.value: etype for etype in ElectrodeType}
+    _ELECTRODE_SIZES = {esize.value: esize for esize in ElectrodeSize}
+    
     def get_style_for_type(self, electrode_type: str, button_size: str = "normal") -> str:
         """Get appropriate style for electrode type and size."""
-        try:
-            etype = ElectrodeType(electrode_type)
-        except ValueError:
-            etype = ElectrodeType.DEFAULT
-        
-        try:
-            esize = ElectrodeSize(button_size)
-        except ValueError:
-            esize = ElectrodeSize.NORMAL
-        
+        etype = self._ELECTRODE_TYPES.get(electrode_type, ElectrodeType.DEFAULT)
+        esize = self._ELECTRODE_SIZES.get(button_size, ElectrodeSize.NORMAL)
         return StyleConfig.get_electrode_style(etype, esize)
     
-    def retranslateUi(self, Form):
-        """Handle UI translation (placeholder for internationalization)."""
-        pass
\ No newline at end of file
+    def apply_electrode_style(self, button: QtWidgets.QPushButton, electrode_type: str,
+                              button_size: str = "normal"):
+        """Switch a button to the form style sheet rule for electrode type and size."""
+        etype = self._ELECTRODE_TYPES.get(electrode_type, ElectrodeType.DEFAULT)
+        esize = self._ELECTRODE_SIZES.get(button_size, ElectrodeSize.NORMAL)
+        button.setProperty("electrodeType", etype.value)
+        button.setProperty("electrodeSize", esize.value)
+        # 动态属性变化后需重新 polish 才会应用新样式
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
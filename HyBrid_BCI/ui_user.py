@@ -5,7 +5,7 @@ Optimized UI file for Patient Information Management System
 Generated from user.ui using PyQt5 UI code generator
 
 Improvements:
-- Better layout management using QGridLayout and QVBoxLayout
+- Better layout management using row QHBoxLayouts inside QVBoxLayouts
 - Improved styling with CSS-like properties
 - Better widget organization and naming conventions
 - Enhanced user experience with placeholders and proper sizing
@@ -15,256 +15,288 @@ Improvements:
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 
+# Form-level style sheet: one parse for the whole form, widgets are selected by object name
+# (only the widgets listed here get an object name)
+_FORM_QSS = """
+    QLabel#titleLabel { font-size: 18px; font-weight: bold; color: #2c3e50; padding: 10px; }
+    QGroupBox#patientInfoGroup { font-weight: bold; font-size: 14px; }
+    QLineEdit[invalid="true"] { border: 2px solid #e74c3c; }
+"""
+
+# Action button colours: (normal, hover, pressed)
+_SAVE_COLORS = ("#3498db", "#2980b9", "#21618c")
+_CLEAR_COLORS = ("#e74c3c", "#c0392b", "#a93226")
+_CANCEL_COLORS = ("#95a5a6", "#7f8c8d", "#6c7b7d")
+
+
+# Patient info fields: (kind, attribute name, row, column, minimum width, text / items / int range and unit)
+_INFO_FIELDS = (
+    ("label", "nameLabel", 0, 0, 80, "姓名："),
+    ("line", "nameLineEdit", 0, 1, 150, "请输入患者姓名"),
+    ("label", "genderLabel", 0, 2, 80, "性别："),
+    ("combo", "genderComboBox", 0, 3, 100, ("男", "女")),
+    ("label", "ageLabel", 1, 0, 0, "年龄："),
+    ("int", "ageLineEdit", 1, 1, 100, (0, 150, "岁")),
+    ("label", "strokeTypeLabel", 1, 2, 0, "卒中类型："),
+    ("combo", "strokeTypeComboBox", 1, 3, 120, ("出血型", "缺血型", "无卒中")),
+    ("label", "durationLabel", 2, 0, 0, "卒中时长："),
+    ("int", "durationLineEdit", 2, 1, 100, (0, 999, "个月")),
+    ("label", "paralysisSideLabel", 2, 2, 0, "偏瘫侧："),
+    ("combo", "paralysisSideComboBox", 2, 3, 100, ("左侧", "右侧", "无")),
+    ("label", "notesLabel", 3, 0, 0, "其他说明："),
+)
+
+
+# QSize is a value type, so the fixed sizes are built once and shared
+_SIZE_FORM_MIN = QtCore.QSize(800, 500)
+_SIZE_BTN = QtCore.QSize(100, 35)
+
+# Enum values resolved once at import instead of per setupUi call
+_ALIGN_CENTER = QtCore.Qt.AlignmentFlag.AlignCenter
+
+# Integer validators shared by every form instance, keyed by (bottom, top)
+_INT_VALIDATORS = {}
+
+
+def _int_validator(bottom, top):
+    validator = _INT_VALIDATORS.get((bottom, top))
+    if validator is None:
+        validator = _INT_VALIDATORS[(bottom, top)] = QtGui.QIntValidator(bottom, top)
+    return validator
+
+
+def int_field_value(line_edit) -> int:
+    """Value of an integer field, 0 when it is empty or out of range"""
+    return int(line_edit.text()) if line_edit.hasAcceptableInput() else 0
+
+
+# Gap between the two label/field pairs of a row
+_PAIR_SPACING = 20
+
+_NOTES_PLACEHOLDER = "请输入其他相关说明信息..."
+_NOTES_HEIGHT = 80
+
+# Translatable texts outside the info grid: (attribute name, setter, source text)
+_TRANSLATED_TEXTS = (
+    ("titleLabel", "setText", "用户信息"),
+    ("patientInfoGroup", "setTitle", "基本信息"),
+    ("saveButton", "setText", "保存"),
+    ("clearButton", "setText", "清空"),
+    ("cancelButton", "setText", "取消"),
+)
+
+
+class ColoredButton(QtWidgets.QPushButton):
+    """Flat rounded push button painted directly from cached brushes (no style sheet)"""
+    
+    # Brushes shared by all buttons, keyed by colour string
+    _BRUSHES = {}
+    
+    def __init__(self, colors, parent=None):
+        super().__init__(parent)
+        brushes = ColoredButton._BRUSHES
+        for color in colors:
+            if color not in brushes:
+                brushes[color] = QtGui.QBrush(QtGui.QColor(color))
+        # Indexed by state: 0 normal, 1 hover, 2 pressed
+        self._brushes = tuple(brushes[color] for color in colors)
+        self.setAttribute(QtCore.Qt.WA_Hover)
+        font = self.font()
+        font.setPixelSize(14)
+        font.setBold(True)
+        self.setFont(font)
+    
+    def paintEvent(self, event):
+        state = 2 if self.isDown() else (1 if self.underMouse() else 0)
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(self._brushes[state])
+        painter.drawRoundedRect(self.rect(), 5, 5)
+        painter.setPen(QtCore.Qt.white)
+        painter.drawText(self.rect(), _ALIGN_CENTER, self.text())
+        painter.end()
+
+
 class Ui_UserInfoForm(object):
+    # Fixed attribute set: the widgets built in setupUi plus the lazy notes editor state
+    # (notesTextEdit itself is a property, see ensure_notes)
+    __slots__ = (
+        "mainLayout", "titleLabel", "patientInfoGroup", "infoGridLayout",
+        "_notes_edit", "_notes_placeholder", "_notes_placeholder_text", "notes_created_callback",
+        "_name_invalid",
+        "buttonLayout", "saveButton", "clearButton", "cancelButton",
+    ) + tuple(field[1] for field in _INFO_FIELDS)
+
     def setupUi(self, UserInfoForm):
+        # Hold repaints while the widgets are added so the form lays out once at the end
+        UserInfoForm.setUpdatesEnabled(False)
+        try:
+            self._build_form(UserInfoForm)
+        finally:
+            UserInfoForm.setUpdatesEnabled(True)
+
+    def _build_form(self, UserInfoForm):
         UserInfoForm.setObjectName("UserInfoForm")
-        UserInfoForm.resize(800, 500)
-        UserInfoForm.setWindowTitle("患者信息管理系统")
-        UserInfoForm.setMinimumSize(QtCore.QSize(800, 500))
+        self._name_invalid = False
+        UserInfoForm.resize(_SIZE_FORM_MIN)
+        UserInfoForm.setMinimumSize(_SIZE_FORM_MIN)
         
         # Main layout
         self.mainLayout = QtWidgets.QVBoxLayout(UserInfoForm)
         self.mainLayout.setContentsMargins(20, 20, 20, 20)
         self.mainLayout.setSpacing(15)
-        self.mainLayout.setObjectName("mainLayout")
         
         # Title label
         self.titleLabel = QtWidgets.QLabel(UserInfoForm)
         self.titleLabel.setObjectName("titleLabel")
-        self.titleLabel.setText("用户信息")
-        self.titleLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.titleLabel.setStyleSheet(
-            "QLabel { font-size: 18px; font-weight: bold; color: #2c3e50; padding: 10px; }"
-        )
+        self.titleLabel.setAlignment(_ALIGN_CENTER)
         self.mainLayout.addWidget(self.titleLabel)
         
         # Patient info group box
         self.patientInfoGroup = QtWidgets.QGroupBox(UserInfoForm)
         self.patientInfoGroup.setObjectName("patientInfoGroup")
-        self.patientInfoGroup.setTitle("基本信息")
-        self.patientInfoGroup.setStyleSheet(
-            "QGroupBox { font-weight: bold; font-size: 14px; }"
-        )
-        
-        # Grid layout for form fields
-        self.infoGridLayout = QtWidgets.QGridLayout(self.patientInfoGroup)
-        self.infoGridLayout.setHorizontalSpacing(20)
-        self.infoGridLayout.setVerticalSpacing(15)
-        self.infoGridLayout.setObjectName("infoGridLayout")
-        
-        # Row 1: Name and Gender
-        self.nameLabel = QtWidgets.QLabel(self.patientInfoGroup)
-        self.nameLabel.setObjectName("nameLabel")
-        self.nameLabel.setText("姓名：")
-        self.nameLabel.setMinimumWidth(80)
-        self.infoGridLayout.addWidget(self.nameLabel, 0, 0)
-        
-        self.nameLineEdit = QtWidgets.QLineEdit(self.patientInfoGroup)
-        self.nameLineEdit.setObjectName("nameLineEdit")
-        self.nameLineEdit.setPlaceholderText("请输入患者姓名")
-        self.nameLineEdit.setMinimumWidth(150)
-        self.infoGridLayout.addWidget(self.nameLineEdit, 0, 1)
-        
-        self.genderLabel = QtWidgets.QLabel(self.patientInfoGroup)
-        self.genderLabel.setObjectName("genderLabel")
-        self.genderLabel.setText("性别：")
-        self.genderLabel.setMinimumWidth(80)
-        self.infoGridLayout.addWidget(self.genderLabel, 0, 2)
-        
-        self.genderComboBox = QtWidgets.QComboBox(self.patientInfoGroup)
-        self.genderComboBox.setObjectName("genderComboBox")
-        self.genderComboBox.setMinimumWidth(100)
-        self.genderComboBox.addItem("男")
-        self.genderComboBox.addItem("女")
-        self.infoGridLayout.addWidget(self.genderComboBox, 0, 3)
-        
-        # Row 2: Age and Stroke Type
-        self.ageLabel = QtWidgets.QLabel(self.patientInfoGroup)
-        self.ageLabel.setObjectName("ageLabel")
-        self.ageLabel.setText("年龄：")
-        self.infoGridLayout.addWidget(self.ageLabel, 1, 0)
-        
-        self.ageSpinBox = QtWidgets.QSpinBox(self.patientInfoGroup)
-        self.ageSpinBox.setObjectName("ageSpinBox")
-        self.ageSpinBox.setMinimum(0)
-        self.ageSpinBox.setMaximum(150)
-        self.ageSpinBox.setSuffix(" 岁")
-        self.ageSpinBox.setMinimumWidth(100)
-        self.infoGridLayout.addWidget(self.ageSpinBox, 1, 1)
-        
-        self.strokeTypeLabel = QtWidgets.QLabel(self.patientInfoGroup)
-        self.strokeTypeLabel.setObjectName("strokeTypeLabel")
-        self.strokeTypeLabel.setText("卒中类型：")
-        self.infoGridLayout.addWidget(self.strokeTypeLabel, 1, 2)
         
-        self.strokeTypeComboBox = QtWidgets.QComboBox(self.patientInfoGroup)
-        self.strokeTypeComboBox.setObjectName("strokeTypeComboBox")
-        self.strokeTypeComboBox.setMinimumWidth(120)
-        self.strokeTypeComboBox.addItem("出血型")
-        self.strokeTypeComboBox.addItem("缺血型")
-        self.strokeTypeComboBox.addItem("无卒中")
-        self.infoGridLayout.addWidget(self.strokeTypeComboBox, 1, 3)
+        # Form fields: a column of independent rows, one QHBoxLayout per table row, which
+        # avoids QGridLayout's column-width negotiation across rows on every resize
+        self.infoGridLayout = QtWidgets.QVBoxLayout(self.patientInfoGroup)
+        self.infoGridLayout.setSpacing(15)
         
-        # Row 3: Duration and Paralysis Side
-        self.durationLabel = QtWidgets.QLabel(self.patientInfoGroup)
-        self.durationLabel.setObjectName("durationLabel")
-        self.durationLabel.setText("卒中时长：")
-        self.infoGridLayout.addWidget(self.durationLabel, 2, 0)
+        # Rows 1-4: fields are created in table order, which is also the tab order
+        rows = {}
+        for kind, name, row, col, min_width, arg in _INFO_FIELDS:
+            if kind == "label":
+                widget = QtWidgets.QLabel(self.patientInfoGroup)
+            elif kind == "line":
+                widget = QtWidgets.QLineEdit(self.patientInfoGroup)
+            elif kind == "combo":
+                # Items must exist before retranslateUi can set their text
+                widget = QtWidgets.QComboBox(self.patientInfoGroup)
+                widget.addItems(arg)
+            else:
+                # Plain line edit with a shared validator: no spin buttons, timers or wheel handling
+                widget = QtWidgets.QLineEdit(self.patientInfoGroup)
+                widget.setValidator(_int_validator(arg[0], arg[1]))
+            if min_width:
+                widget.setMinimumWidth(min_width)
+            row_layout = rows.get(row)
+            if row_layout is None:
+                row_layout = rows[row] = QtWidgets.QHBoxLayout()
+                self.infoGridLayout.addLayout(row_layout)
+            if col == 2:
+                row_layout.addSpacing(_PAIR_SPACING)
+            # Labels keep their size hint, input widgets share the remaining width
+            row_layout.addWidget(widget, 0 if kind == "label" else 1)
+            setattr(self, name, widget)
         
-        self.durationSpinBox = QtWidgets.QSpinBox(self.patientInfoGroup)
-        self.durationSpinBox.setObjectName("durationSpinBox")
-        self.durationSpinBox.setMinimum(0)
-        self.durationSpinBox.setMaximum(999)
-        self.durationSpinBox.setSuffix(" 个月")
-        self.durationSpinBox.setMinimumWidth(100)
-        self.infoGridLayout.addWidget(self.durationSpinBox, 2, 1)
-        
-        self.paralysisSideLabel = QtWidgets.QLabel(self.patientInfoGroup)
-        self.paralysisSideLabel.setObjectName("paralysisSideLabel")
-        self.paralysisSideLabel.setText("偏瘫侧：")
-        self.infoGridLayout.addWidget(self.paralysisSideLabel, 2, 2)
-        
-        self.paralysisSideComboBox = QtWidgets.QComboBox(self.patientInfoGroup)
-        self.paralysisSideComboBox.setObjectName("paralysisSideComboBox")
-        self.paralysisSideComboBox.setMinimumWidth(100)
-        self.paralysisSideComboBox.addItem("左侧")
-        self.paralysisSideComboBox.addItem("右侧")
-        self.paralysisSideComboBox.addItem("无")
-        self.infoGridLayout.addWidget(self.paralysisSideComboBox, 2, 3)
-        
-        # Row 4: Additional Notes
-        self.notesLabel = QtWidgets.QLabel(self.patientInfoGroup)
-        self.notesLabel.setObjectName("notesLabel")
-        self.notesLabel.setText("其他说明：")
-        self.infoGridLayout.addWidget(self.notesLabel, 3, 0)
-        
-        self.notesTextEdit = QtWidgets.QTextEdit(self.patientInfoGroup)
-        self.notesTextEdit.setObjectName("notesTextEdit")
-        self.notesTextEdit.setMaximumHeight(80)
-        self.notesTextEdit.setPlaceholderText("请输入其他相关说明信息...")
-        self.infoGridLayout.addWidget(self.notesTextEdit, 3, 1, 1, 3)
+        # Notes editor: QTextEdit is comparatively heavy, so a placeholder of the same
+        # height holds its cell until ensure_notes() or the first notesTextEdit access
+        self._notes_edit = None
+        # Called with the editor once ensure_notes() creates it, so signals can be wired then
+        self.notes_created_callback = None
+        self._notes_placeholder_text = _NOTES_PLACEHOLDER
+        self._notes_placeholder = QtWidgets.QWidget(self.patientInfoGroup)
+        self._notes_placeholder.setFixedHeight(_NOTES_HEIGHT)
+        rows[3].addWidget(self._notes_placeholder, 1)
         
         self.mainLayout.addWidget(self.patientInfoGroup)
         
-        # Vertical spacer
-        spacerItem = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, 
-                                          QtWidgets.QSizePolicy.Expanding)
-        self.mainLayout.addItem(spacerItem)
+        # Vertical stretch
+        self.mainLayout.addStretch(1)
         
         # Button layout
         self.buttonLayout = QtWidgets.QHBoxLayout()
-        self.buttonLayout.setObjectName("buttonLayout")
         
-        # Button spacer
-        buttonSpacer1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, 
-                                            QtWidgets.QSizePolicy.Minimum)
-        self.buttonLayout.addItem(buttonSpacer1)
+        # Center the buttons between two stretches
+        self.buttonLayout.addStretch(1)
         
         # Save button
-        self.saveButton = QtWidgets.QPushButton(UserInfoForm)
-        self.saveButton.setObjectName("saveButton")
-        self.saveButton.setText("保存")
-        self.saveButton.setMinimumSize(QtCore.QSize(100, 35))
-        self.saveButton.setStyleSheet("""
-            QPushButton { 
-                background-color: #3498db; 
-                color: white; 
-                border: none; 
-                border-radius: 5px; 
-                font-size: 14px; 
-                font-weight: bold; 
-            }
-            QPushButton:hover { 
-                background-color: #2980b9; 
-            }
-            QPushButton:pressed { 
-                background-color: #21618c; 
-            }
-        """)
+        self.saveButton = ColoredButton(_SAVE_COLORS, UserInfoForm)
+        self.saveButton.setMinimumSize(_SIZE_BTN)
         self.buttonLayout.addWidget(self.saveButton)
         
         # Clear button
-        self.clearButton = QtWidgets.QPushButton(UserInfoForm)
-        self.clearButton.setObjectName("clearButton")
-        self.clearButton.setText("清空")
-        self.clearButton.setMinimumSize(QtCore.QSize(100, 35))
-        self.clearButton.setStyleSheet("""
-            QPushButton { 
-                background-color: #e74c3c; 
-                color: white; 
-                border: none; 
-                border-radius: 5px; 
-                font-size: 14px; 
-                font-weight: bold; 
-            }
-            QPushButton:hover { 
-                background-color: #c0392b; 
-            }
-            QPushButton:pressed { 
-                background-color: #a93226; 
-            }
-        """)
+        self.clearButton = ColoredButton(_CLEAR_COLORS, UserInfoForm)
+        self.clearButton.setMinimumSize(_SIZE_BTN)
         self.buttonLayout.addWidget(self.clearButton)
         
         # Cancel button
-        self.cancelButton = QtWidgets.QPushButton(UserInfoForm)
-        self.cancelButton.setObjectName("cancelButton")
-        self.cancelButton.setText("取消")
-        self.cancelButton.setMinimumSize(QtCore.QSize(100, 35))
-        self.cancelButton.setStyleSheet("""
-            QPushButton { 
-                background-color: #95a5a6; 
-                color: white; 
-                border: none; 
-                border-radius: 5px; 
-                font-size: 14px; 
-                font-weight: bold; 
-            }
-            QPushButton:hover { 
-                background-color: #7f8c8d; 
-            }
-            QPushButton:pressed { 
-                background-color: #6c7b7d; 
-            }
-        """)
+        self.cancelButton = ColoredButton(_CANCEL_COLORS, UserInfoForm)
+        self.cancelButton.setMinimumSize(_SIZE_BTN)
         self.buttonLayout.addWidget(self.cancelButton)
         
-        # Button spacer
-        buttonSpacer2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, 
-                                            QtWidgets.QSizePolicy.Minimum)
-        self.buttonLayout.addItem(buttonSpacer2)
+        self.buttonLayout.addStretch(1)
         
         self.mainLayout.addLayout(self.buttonLayout)
         
-        # Connect slots
-        QtCore.QMetaObject.connectSlotsByName(UserInfoForm)
+        UserInfoForm.setStyleSheet(_FORM_QSS)
+        # All user-visible strings are set here (and again by UserInfoManager on LanguageChange)
+        self.retranslateUi(UserInfoForm)
+        # No on_<objectName>_<signal> slots exist, so connectSlotsByName is not called;
+        # UserInfoManager.setup_connections wires every signal explicitly
+
+    @property
+    def notesTextEdit(self) -> QtWidgets.QTextEdit:
+        return self.ensure_notes()
+
+    def has_notes(self) -> bool:
+        """Whether the notes editor has been created yet"""
+        return self._notes_edit is not None
+
+    def ensure_notes(self) -> QtWidgets.QTextEdit:
+        """Create the notes editor in place of its placeholder on first use"""
+        if self._notes_edit is None:
+            edit = QtWidgets.QTextEdit(self.patientInfoGroup)
+            edit.setMaximumHeight(_NOTES_HEIGHT)
+            edit.setPlaceholderText(self._notes_placeholder_text)
+            # replaceWidget searches nested row layouts as well
+            self.infoGridLayout.replaceWidget(self._notes_placeholder, edit)
+            self._notes_placeholder.deleteLater()
+            self._notes_placeholder = None
+            # Created last, so put it back after the info fields in the tab chain
+            QtWidgets.QWidget.setTabOrder(self.paralysisSideComboBox, edit)
+            self._notes_edit = edit
+            if self.notes_created_callback is not None:
+                self.notes_created_callback(edit)
+        return self._notes_edit
+
+    def set_name_invalid(self, invalid: bool):
+        """Toggle the invalid-input border on the name field"""
+        # Only repolish on an actual change; validation runs for every edit burst
+        if invalid == self._name_invalid:
+            return
+        self._name_invalid = invalid
+        edit = self.nameLineEdit
+        edit.setProperty("invalid", invalid)
+        # 动态属性变化后需重新 polish 才会应用新样式
+        style = edit.style()
+        style.unpolish(edit)
+        style.polish(edit)
 
     def retranslateUi(self, UserInfoForm):
         """Set up translations for the UI elements"""
-        _translate = QtCore.QCoreApplication.translate
-        UserInfoForm.setWindowTitle(_translate("UserInfoForm", "患者信息管理系统"))
-        self.titleLabel.setText(_translate("UserInfoForm", "患者信息录入"))
-        self.patientInfoGroup.setTitle(_translate("UserInfoForm", "基本信息"))
-        self.nameLabel.setText(_translate("UserInfoForm", "姓名："))
-        self.nameLineEdit.setPlaceholderText(_translate("UserInfoForm", "请输入患者姓名"))
-        self.genderLabel.setText(_translate("UserInfoForm", "性别："))
-        self.genderComboBox.setItemText(0, _translate("UserInfoForm", "男"))
-        self.genderComboBox.setItemText(1, _translate("UserInfoForm", "女"))
-        self.ageLabel.setText(_translate("UserInfoForm", "年龄："))
-        self.strokeTypeLabel.setText(_translate("UserInfoForm", "卒中类型："))
-        self.strokeTypeComboBox.setItemText(0, _translate("UserInfoForm", "出血型"))
-        self.strokeTypeComboBox.setItemText(1, _translate("UserInfoForm", "缺血型"))
-        self.strokeTypeComboBox.setItemText(2, _translate("UserInfoForm", "无卒中"))
-        self.durationLabel.setText(_translate("UserInfoForm", "卒中时长："))
-        self.paralysisSideLabel.setText(_translate("UserInfoForm", "偏瘫侧："))
-        self.paralysisSideComboBox.setItemText(0, _translate("UserInfoForm", "左侧"))
-        self.paralysisSideComboBox.setItemText(1, _translate("UserInfoForm", "右侧"))
-        self.paralysisSideComboBox.setItemText(2, _translate("UserInfoForm", "无"))
-        self.notesLabel.setText(_translate("UserInfoForm", "其他说明："))
-        self.notesTextEdit.setPlaceholderText(_translate("UserInfoForm", "请输入其他相关说明信息..."))
-        self.saveButton.setText(_translate("UserInfoForm", "保存"))
-        self.clearButton.setText(_translate("UserInfoForm", "清空"))
-        self.cancelButton.setText(_translate("UserInfoForm", "取消"))
+        _tr = QtCore.QCoreApplication.translate
+        _ctx = "UserInfoForm"
+        UserInfoForm.setWindowTitle(_tr(_ctx, "患者信息管理系统"))
+        for attr, setter, text in _TRANSLATED_TEXTS:
+            getattr(getattr(self, attr), setter)(_tr(_ctx, text))
+        
+        # Don't force the lazy notes editor into existence just to translate it
+        self._notes_placeholder_text = _tr(_ctx, _NOTES_PLACEHOLDER)
+        if self._notes_edit is not None:
+            self._notes_edit.setPlaceholderText(self._notes_placeholder_text)
+        
+        for kind, name, _, _, _, arg in _INFO_FIELDS:
+            widget = getattr(self, name)
+            if kind == "label":
+                widget.setText(_tr(_ctx, arg))
+            elif kind == "line":
+                widget.setPlaceholderText(_tr(_ctx, arg))
+            elif kind == "int":
+                widget.setPlaceholderText(_tr(_ctx, arg[2]))
+            elif kind == "combo":
+                for index, text in enumerate(arg):
+                    widget.setItemText(index, _tr(_ctx, text))
 
 
 if __name__ == "__main__":
@@ -18,13 +18,13 @@ Date: 2025
 
 import sys
 import csv
+import copy
 import os
-import pandas as pd
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-from pypinyin import pinyin, Style
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from PyQt5 import QtWidgets, QtCore, QtGui
-from ui_user import Ui_UserInfoForm
+from ui_user import Ui_UserInfoForm, int_field_value
 import logging
 
 # Configure logging
@@ -32,9 +32,40 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _name_initials(name: str) -> str:
+    """Upper-case pinyin initials of a name, cached so repeated saves skip pypinyin's segmentation"""
+    # pypinyin loads its phrase dictionaries on import, so defer it to the first save
+    from pypinyin import pinyin, Style
+    # 获取每个字的拼音首字母，大写后连接（跳过空列表）
+    return ''.join(i[0].upper() for i in pinyin(name, style=Style.FIRST_LETTER) if i)
+
+
+# Quiet period after the last form edit before validation and timestamping run
+_FORM_CHANGE_DELAY_MS = 50
+# Delay after the last save before queued patient records are written to the CSV
+_CSV_FLUSH_DELAY_MS = 2000
+
+
+def _combo_indices(combo: QtWidgets.QComboBox) -> Dict[str, int]:
+    """Map each item text of a combo box to its index"""
+    return {combo.itemText(i): i for i in range(combo.count())}
+
+
 class PatientData:
     """Data class for patient information"""
     
+    __slots__ = ("name", "gender", "age", "stroke_type", "duration_months", "paralysis_side",
+                 "additional_notes", "updated_at", "initials", "_row_cache")
+    
+    # Attributes that are not part of the CSV row and so keep the cached row valid
+    _ROW_NEUTRAL = frozenset(("initials", "_row_cache"))
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name not in PatientData._ROW_NEUTRAL:
+            object.__setattr__(self, "_row_cache", None)
+    
     def __init__(self):
         self.name: str = ""
         self.gender: str = "男"
@@ -70,25 +101,26 @@ class PatientData:
         self.additional_notes = data.get("其他信息", "")
         self.updated_at = data.get("修改时间", "")
     
-    def to_csv_row(self) -> List[str]:
-        """Convert patient data to CSV row"""
-        return [
-            self.name,
-            self.gender,
-            str(self.age),
-            self.stroke_type,
-            str(self.duration_months),
-            self.paralysis_side,
-            self.additional_notes,
-            self.updated_at
-        ]
+    def to_csv_row(self) -> Tuple[str, ...]:
+        """Convert patient data to CSV row (cached until a field changes)"""
+        row = self._row_cache
+        if row is None:
+            row = (
+                self.name,
+                self.gender,
+                str(self.age),
+                self.stroke_type,
+                str(self.duration_months),
+                self.paralysis_side,
+                self.additional_notes,
+                self.updated_at
+            )
+            object.__setattr__(self, "_row_cache", row)
+        return row
     
     def getNameInitials(self) -> str:
         """Get initials from name"""
-         # 获取每个字的拼音首字母（小写）
-        initials_list = pinyin(self.name, style=Style.FIRST_LETTER)
-        # 将每个首字母大写并连接成一个字符串
-        self.initials = ''.join([i[0].upper() for i in initials_list if i]) + '_' + str(self.age) # 确保列表不为空
+        self.initials = _name_initials(self.name) + '_' + str(self.age)
         logger.info(f"Generated initials for {self.name}: {self.initials}")
         return self.initials
     
@@ -106,7 +138,32 @@ class CSVManager:
     
     def __init__(self, csv_file_path: str):
         self.csv_file_path = csv_file_path
+        # In-memory copy of the file keyed by normalized name; all lookups go through it
+        self._index: Dict[str, PatientData] = {}
+        # Data rows in the file (including queued ones); updates are appended, so this can
+        # exceed len(_index)
+        self._row_count = 0
+        # Records saved to the index but not yet appended to the file, see flush()
+        self._pending: List[PatientData] = []
+        # (mtime, size) of the file as last read or written by us, see _reload_if_changed()
+        self._file_state = None
         self.ensure_csv_file()
+        self._load_index()
+    
+    @staticmethod
+    def _name_key(name: str) -> str:
+        """Normalized name used as the index key"""
+        return name.strip().lower()
+    
+    @staticmethod
+    def _patient_from_row(row: Dict[str, Any]) -> PatientData:
+        """Build a PatientData from a CSV row"""
+        patient = PatientData()
+        # Convert numeric fields
+        row['年龄'] = int(row['年龄']) if row['年龄'] else 0
+        row['卒中时长'] = int(row['卒中时长']) if row['卒中时长'] else 0
+        patient.from_dict(row)
+        return patient
     
     def ensure_csv_file(self):
         """Ensure CSV file exists with proper headers"""
@@ -120,49 +177,84 @@ class CSVManager:
                 print(f"Error creating CSV file: {e}")
                 raise
     
-    def user_exists(self, name: str) -> bool:
-        """Check if user exists in CSV file"""
+    def _load_index(self):
+        """Read the CSV file once into the name index"""
+        self._index.clear()
+        self._row_count = 0
         try:
-            if not os.path.exists(self.csv_file_path):
-                return False
-            
             with open(self.csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['姓名'].strip().lower() == name.strip().lower():
-                        return True
-            return False
+                for row in csv.DictReader(file):
+                    # The file is a latest-wins log: a later row for a name replaces earlier ones
+                    self._index[self._name_key(row['姓名'])] = self._patient_from_row(row)
+                    self._row_count += 1
+            self._remember_file_state()
         except Exception as e:
-            print(f"Error checking user existence: {e}")
-            return False
+            print(f"Error loading CSV file: {e}")
+    
+    def _stat_file(self):
+        st = os.stat(self.csv_file_path)
+        return st.st_mtime_ns, st.st_size
+    
+    def _remember_file_state(self):
+        """Record the file state after our own read or write"""
+        try:
+            self._file_state = self._stat_file()
+        except OSError:
+            self._file_state = None
+    
+    def _reload_if_changed(self):
+        """Reload the index if another process changed the file since we last touched it"""
+        try:
+            state = self._stat_file()
+        except OSError:
+            return
+        if state == self._file_state:
+            return
+        # Write our queued rows first so the reload keeps them (later rows win); if that
+        # fails, keep the current index so the queued records stay visible
+        if not self.flush():
+            return
+        self._load_index()
+    
+    def user_exists(self, name: str) -> bool:
+        """Check if user exists in CSV file"""
+        self._reload_if_changed()
+        return self._name_key(name) in self._index
     
     def get_user_data(self, name: str) -> Optional[PatientData]:
         """Get existing user data from CSV"""
+        self._reload_if_changed()
+        patient = self._index.get(self._name_key(name))
+        # Callers edit the returned record (e.g. as current_patient), so hand out a copy
+        return copy.copy(patient) if patient is not None else None
+    
+    def _append_row(self, patient: PatientData):
+        """Add one record to the index and queue it for the file"""
+        record = copy.copy(patient)
+        self._index[self._name_key(patient.name)] = record
+        self._pending.append(record)
+        self._row_count += 1
+    
+    def flush(self) -> bool:
+        """Append all queued records to the file in one write"""
+        if not self._pending:
+            return True
         try:
-            if not os.path.exists(self.csv_file_path):
-                return None
-            
-            with open(self.csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['姓名'].strip().lower() == name.strip().lower():
-                        patient = PatientData()
-                        # Convert age and duration to int
-                        row['年龄'] = int(row['年龄']) if row['年龄'] else 0
-                        row['卒中时长'] = int(row['卒中时长']) if row['卒中时长'] else 0
-                        patient.from_dict(row)
-                        return patient
-            return None
+            with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerows(p.to_csv_row() for p in self._pending)
+            self._pending.clear()
+            self._remember_file_state()
+            return True
         except Exception as e:
-            print(f"Error getting user data: {e}")
-            return None
+            # Keep the queue so the next flush retries
+            print(f"Error writing patient records: {e}")
+            return False
     
     def add_patient(self, patient: PatientData) -> bool:
         """Add new patient to CSV file"""
         try:
-            with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(patient.to_csv_row())
+            self._append_row(patient)
             return True
         except Exception as e:
             print(f"Error adding patient: {e}")
@@ -171,50 +263,30 @@ class CSVManager:
     def update_patient(self, patient: PatientData) -> bool:
         """Update existing patient in CSV file"""
         try:
-            # Read all data
-            rows = []
-            with open(self.csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                headers = reader.fieldnames
-                for row in reader:
-                    if row['姓名'].strip().lower() == patient.name.strip().lower():
-                        # Update the row
-                        updated_row = patient.to_dict()
-                        rows.append(updated_row)
-                    else:
-                        rows.append(row)
-            
-            # Write back all data
-            with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(rows)
-            
+            # Append the new version instead of rewriting the file; readers take the last row
+            self._append_row(patient)
+            if self._row_count > 2 * len(self._index):
+                self.compact()
             return True
         except Exception as e:
             print(f"Error updating patient: {e}")
             return False
     
+    def compact(self):
+        """Rewrite the file with one row per patient, dropping superseded versions"""
+        with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(PatientData.get_csv_headers())
+            writer.writerows(p.to_csv_row() for p in self._index.values())
+        # The index already holds the queued records, so they are written now too
+        self._pending.clear()
+        self._row_count = len(self._index)
+        self._remember_file_state()
+    
     def get_all_patients(self) -> List[PatientData]:
         """Get all patients from CSV file"""
-        patients = []
-        try:
-            if not os.path.exists(self.csv_file_path):
-                return patients
-            
-            with open(self.csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    patient = PatientData()
-                    # Convert numeric fields
-                    row['年龄'] = int(row['年龄']) if row['年龄'] else 0
-                    row['卒中时长'] = int(row['卒中时长']) if row['卒中时长'] else 0
-                    patient.from_dict(row)
-                    patients.append(patient)
-        except Exception as e:
-            print(f"Error getting all patients: {e}")
-        
-        return patients
+        self._reload_if_changed()
+        return [copy.copy(patient) for patient in self._index.values()]
 
 
 class UserInfoManager(QtWidgets.QWidget):
@@ -236,6 +308,21 @@ class UserInfoManager(QtWidgets.QWidget):
         
         # Current patient data
         self.current_patient = PatientData()
+        # Normalized name last handled by check_existing_user
+        self._last_checked_name = None
+        self._emit_user_set = self.onUserSet.emit
+        # Item text -> index maps for the combo boxes
+        self.build_combo_indices()
+        
+        # Saved records are written to the CSV in batches: shortly after the last save,
+        # and at the latest when the form closes or the application quits
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_CSV_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush_patient_records)
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_patient_records)
         
         # Setup UI connections
         self.setup_connections()
@@ -246,6 +333,12 @@ class UserInfoManager(QtWidgets.QWidget):
         # Set window properties
         self.center_window()
     
+    def build_combo_indices(self):
+        """(Re)build the item text -> index maps after the combo items were (re)translated"""
+        self._gender_indices = _combo_indices(self.ui.genderComboBox)
+        self._stroke_indices = _combo_indices(self.ui.strokeTypeComboBox)
+        self._paralysis_indices = _combo_indices(self.ui.paralysisSideComboBox)
+    
     def ensure_data_directory(self):
         """Ensure the data directory exists"""
         try:
@@ -263,21 +356,51 @@ class UserInfoManager(QtWidgets.QWidget):
         self.ui.clearButton.clicked.connect(self.clear_form)
         self.ui.cancelButton.clicked.connect(self.close)
         
-        # Form validation connections
-        self.ui.nameLineEdit.textChanged.connect(lambda: self.validate_form())
-        self.ui.ageSpinBox.valueChanged.connect(lambda: self.validate_form())
+        # Form changes are coalesced: bursts of edits (typing, paste, IME) restart one
+        # short single-shot timer, which then validates and stamps the form once
+        self._form_changed_timer = QtCore.QTimer(self)
+        self._form_changed_timer.setSingleShot(True)
+        self._form_changed_timer.setInterval(_FORM_CHANGE_DELAY_MS)
+        self._form_changed_timer.timeout.connect(self.apply_form_changes)
         
-        # Auto-update timestamp when form changes
-        self.ui.nameLineEdit.textChanged.connect(self.mark_form_modified)
-        self.ui.genderComboBox.currentTextChanged.connect(self.mark_form_modified)
-        self.ui.ageSpinBox.valueChanged.connect(self.mark_form_modified)
-        self.ui.strokeTypeComboBox.currentTextChanged.connect(self.mark_form_modified)
-        self.ui.durationSpinBox.valueChanged.connect(self.mark_form_modified)
-        self.ui.paralysisSideComboBox.currentTextChanged.connect(self.mark_form_modified)
-        self.ui.notesTextEdit.textChanged.connect(self.mark_form_modified)
+        self.ui.nameLineEdit.textChanged.connect(self.schedule_form_changes)
+        self.ui.genderComboBox.currentTextChanged.connect(self.schedule_form_changes)
+        self.ui.ageLineEdit.textChanged.connect(self.schedule_form_changes)
+        self.ui.strokeTypeComboBox.currentTextChanged.connect(self.schedule_form_changes)
+        self.ui.durationLineEdit.textChanged.connect(self.schedule_form_changes)
+        self.ui.paralysisSideComboBox.currentTextChanged.connect(self.schedule_form_changes)
         
         # Add name field change event for user checking
         self.ui.nameLineEdit.editingFinished.connect(self.check_existing_user)
+        
+        # The notes editor is created on first show or first access; wire it up then
+        self.ui.notes_created_callback = self.setup_notes_connection
+    
+    def setup_notes_connection(self, notes_edit: QtWidgets.QTextEdit):
+        """Connect the notes editor once it has been created"""
+        notes_edit.textChanged.connect(self.schedule_form_changes)
+    
+    def flush_patient_records(self) -> bool:
+        """Write queued patient records to the CSV file, reporting a failed write"""
+        if self.csv_manager.flush():
+            return True
+        QtWidgets.QMessageBox.critical(
+            self, "写入失败",
+            f"患者信息未能写入文件：\n{self.csv_manager.csv_file_path}\n\n"
+            f"请检查数据目录是否可写，未写入的记录将在下次保存时重试。"
+        )
+        return False
+    
+    def schedule_form_changes(self):
+        """(Re)start the form change timer"""
+        # Not connected to QTimer.start directly: its start(int) overload would take
+        # valueChanged/textChanged arguments as the interval
+        self._form_changed_timer.start()
+    
+    def apply_form_changes(self):
+        """Handle a settled burst of form edits"""
+        self.mark_form_modified()
+        self.validate_form()
     
     def center_window(self):
         """Center the window on screen"""
@@ -291,18 +414,16 @@ class UserInfoManager(QtWidgets.QWidget):
     def validate_form(self) -> None:
         """Validate form input and enable/disable save button"""
         try:
-            name = self.ui.nameLineEdit.text().strip()
-            age = self.ui.ageSpinBox.value()
+            ui = self.ui
+            name = ui.nameLineEdit.text().strip()
+            age = int_field_value(ui.ageLineEdit)
             
             is_valid = len(name) >= 2 and age > 0
             
-            self.ui.saveButton.setEnabled(is_valid)
+            ui.saveButton.setEnabled(is_valid)
             
             # Visual feedback for name field
-            if len(name) < 2 and len(name) > 0:
-                self.ui.nameLineEdit.setStyleSheet("border: 2px solid #e74c3c;")
-            else:
-                self.ui.nameLineEdit.setStyleSheet("")
+            ui.set_name_invalid(0 < len(name) < 2)
                 
         except AttributeError as e:
             print(f"UI element not found during validation: {e}")
@@ -311,7 +432,7 @@ class UserInfoManager(QtWidgets.QWidget):
         """Check if form is valid"""
         try:
             name = self.ui.nameLineEdit.text().strip()
-            age = self.ui.ageSpinBox.value()
+            age = int_field_value(self.ui.ageLineEdit)
             return len(name) >= 2 and age > 0
         except AttributeError:
             return False
@@ -323,39 +444,41 @@ class UserInfoManager(QtWidgets.QWidget):
     def check_existing_user(self) -> None:
         """Check if user exists and load data if found"""
         name = self.ui.nameLineEdit.text().strip()
-        if len(name) < 2:
+        key = name.lower()
+        # Focus leaving an unchanged name field must not re-run the lookup or dialog
+        if len(name) < 2 or key == self._last_checked_name:
             return
         
-        if self.csv_manager.user_exists(name):
+        existing_patient = self.csv_manager.get_user_data(name)
+        if existing_patient is not None:
             # User exists, ask what to do
-            existing_patient = self.csv_manager.get_user_data(name)
-            if existing_patient:
-                reply = QtWidgets.QMessageBox.question(
-                    self, "用户已存在", 
-                    f"用户 '{name}' 已存在。\n\n"
-                    f"现有信息：\n"
-                    f"性别: {existing_patient.gender}\n"
-                    f"年龄: {existing_patient.age}\n"
-                    f"卒中类型: {existing_patient.stroke_type}\n\n"
-                    f"是否要加载现有用户信息进行编辑？",
-                    QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-                    QtWidgets.QMessageBox.Yes
-                )
-                
-                if reply == QtWidgets.QMessageBox.Yes:
-                    self.populate_form(existing_patient)
-                    # Change save button text to indicate update
-                    self.ui.saveButton.setText("设置")
-                else:
-                    # Clear other fields but keep the name
-                    current_name = self.ui.nameLineEdit.text()
-                    self.clear_form()
-                    self.ui.nameLineEdit.setText(current_name)
-                    self.ui.saveButton.setText("设置")
+            reply = QtWidgets.QMessageBox.question(
+                self, "用户已存在", 
+                f"用户 '{name}' 已存在。\n\n"
+                f"现有信息：\n"
+                f"性别: {existing_patient.gender}\n"
+                f"年龄: {existing_patient.age}\n"
+                f"卒中类型: {existing_patient.stroke_type}\n\n"
+                f"是否要加载现有用户信息进行编辑？",
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                QtWidgets.QMessageBox.Yes
+            )
+            
+            if reply == QtWidgets.QMessageBox.Yes:
+                self.populate_form(existing_patient)
+                # Change save button text to indicate update
+                self.ui.saveButton.setText("设置")
+            else:
+                # Clear other fields but keep the name
+                current_name = self.ui.nameLineEdit.text()
+                self.clear_form()
+                self.ui.nameLineEdit.setText(current_name)
+                self.ui.saveButton.setText("设置")
         else:
-            # New user
+            # New user; onUserSet is emitted once the record has been saved
             self.ui.saveButton.setText("设置")
-            onUserSet.emit(self.current_patient.initials)
+        # Set last: clear_form above resets it
+        self._last_checked_name = key
     
     def collect_form_data(self) -> PatientData:
         """Collect data from form fields"""
@@ -364,11 +487,12 @@ class UserInfoManager(QtWidgets.QWidget):
         try:
             patient.name = self.ui.nameLineEdit.text().strip()
             patient.gender = self.ui.genderComboBox.currentText()
-            patient.age = self.ui.ageSpinBox.value()
+            patient.age = int_field_value(self.ui.ageLineEdit)
             patient.stroke_type = self.ui.strokeTypeComboBox.currentText()
-            patient.duration_months = self.ui.durationSpinBox.value()
+            patient.duration_months = int_field_value(self.ui.durationLineEdit)
             patient.paralysis_side = self.ui.paralysisSideComboBox.currentText()
-            patient.additional_notes = self.ui.notesTextEdit.toPlainText().strip()
+            if self.ui.has_notes():
+                patient.additional_notes = self.ui.notesTextEdit.toPlainText().strip()
             
             # Set timestamps
             current_time = datetime.now().isoformat()
@@ -382,28 +506,30 @@ class UserInfoManager(QtWidgets.QWidget):
         
         return patient
     
+    @staticmethod
+    def _select_combo_text(combo: QtWidgets.QComboBox, indices: Dict[str, int], text: str):
+        """Select the item with the given text, leaving the combo unchanged if there is none"""
+        index = indices.get(text)
+        if index is not None:
+            combo.setCurrentIndex(index)
+    
     def populate_form(self, patient: PatientData) -> None:
         """Populate form with patient data"""
         self.ui.nameLineEdit.setText(patient.name)
         
         # Set gender
-        gender_index = self.ui.genderComboBox.findText(patient.gender)
-        if gender_index >= 0:
-            self.ui.genderComboBox.setCurrentIndex(gender_index)
+        self._select_combo_text(self.ui.genderComboBox, self._gender_indices, patient.gender)
         
-        self.ui.ageSpinBox.setValue(patient.age)
+        self.ui.ageLineEdit.setText(str(patient.age))
         
         # Set stroke type
-        stroke_index = self.ui.strokeTypeComboBox.findText(patient.stroke_type)
-        if stroke_index >= 0:
-            self.ui.strokeTypeComboBox.setCurrentIndex(stroke_index)
+        self._select_combo_text(self.ui.strokeTypeComboBox, self._stroke_indices, patient.stroke_type)
         
-        self.ui.durationSpinBox.setValue(patient.duration_months)
+        self.ui.durationLineEdit.setText(str(patient.duration_months))
         
         # Set paralysis side
-        paralysis_index = self.ui.paralysisSideComboBox.findText(patient.paralysis_side)
-        if paralysis_index >= 0:
-            self.ui.paralysisSideComboBox.setCurrentIndex(paralysis_index)
+        self._select_combo_text(self.ui.paralysisSideComboBox, self._paralysis_indices,
+                                patient.paralysis_side)
         
         self.ui.notesTextEdit.setPlainText(patient.additional_notes)
         
@@ -413,14 +539,16 @@ class UserInfoManager(QtWidgets.QWidget):
         """Clear all form fields"""
         self.ui.nameLineEdit.clear()
         self.ui.genderComboBox.setCurrentIndex(0)
-        self.ui.ageSpinBox.setValue(0)
+        self.ui.ageLineEdit.clear()
         self.ui.strokeTypeComboBox.setCurrentIndex(2)  # Default to "无卒中"
-        self.ui.durationSpinBox.setValue(0)
+        self.ui.durationLineEdit.clear()
         self.ui.paralysisSideComboBox.setCurrentIndex(2)  # Default to "无"
-        self.ui.notesTextEdit.clear()
+        if self.ui.has_notes():
+            self.ui.notesTextEdit.clear()
         
         # Reset styling
-        self.ui.nameLineEdit.setStyleSheet("")
+        self.ui.set_name_invalid(False)
+        self._last_checked_name = None
         
         # Reset current patient
         self.current_patient = PatientData()
@@ -444,9 +572,7 @@ class UserInfoManager(QtWidgets.QWidget):
             patient = self.collect_form_data()
             
             # Check if user exists
-            user_exists = self.csv_manager.user_exists(patient.name)
-            
-            if user_exists:
+            if self.csv_manager.get_user_data(patient.name) is not None:
                 # Ask user if they want to update or abandon
                 reply = QtWidgets.QMessageBox.question(
                     self, "用户已存在", 
@@ -460,9 +586,6 @@ class UserInfoManager(QtWidgets.QWidget):
                 
                 if reply == QtWidgets.QMessageBox.Yes:
                     # Update existing user
-                    # Preserve created_at from existing record
-                    existing_patient = self.csv_manager.get_user_data(patient.name)
-                    
                     success = self.csv_manager.update_patient(patient)
                     if success:
                         QtWidgets.QMessageBox.information(
@@ -496,8 +619,11 @@ class UserInfoManager(QtWidgets.QWidget):
                     )
                     return
             
-            # offer a file name to save data
-            self.current_patient.getNameInitials()
+            self._flush_timer.start()
+            
+            # The saved record becomes the current patient; offer its initials as a file name
+            self.current_patient = patient
+            self._emit_user_set(patient.getNameInitials())
         
         except Exception as e:
             QtWidgets.QMessageBox.critical(
@@ -505,12 +631,25 @@ class UserInfoManager(QtWidgets.QWidget):
             )
             print(f"Error saving patient data: {str(e)}")
     
+    def showEvent(self, event) -> None:
+        """Create the notes editor the first time the form is shown"""
+        self.ui.ensure_notes()
+        super().showEvent(event)
+    
+    def changeEvent(self, event) -> None:
+        """Retranslate the form after a language change"""
+        if event.type() == QtCore.QEvent.LanguageChange:
+            self.ui.retranslateUi(self)
+            # retranslateUi rewrites the combo item texts
+            self.build_combo_indices()
+        super().changeEvent(event)
+    
     def closeEvent(self, event) -> None:
         """Handle window close event"""
-        # Check if form has unsaved changes
-        current_data = self.collect_form_data()
-        if (current_data.name.strip() or current_data.age > 0 or 
-            current_data.additional_notes.strip()):
+        # Check if form has unsaved changes (only the three fields that decide it are read)
+        ui = self.ui
+        if (ui.nameLineEdit.text().strip() or int_field_value(ui.ageLineEdit) > 0 or
+                (ui.has_notes() and ui.notesTextEdit.toPlainText().strip())):
             
             reply = QtWidgets.QMessageBox.question(
                 self, "确认退出", 
@@ -523,6 +662,17 @@ class UserInfoManager(QtWidgets.QWidget):
                 event.ignore()
                 return
         
+        self._flush_timer.stop()
+        if not self.flush_patient_records():
+            reply = QtWidgets.QMessageBox.question(
+                self, "确认退出",
+                "患者信息尚未写入文件，退出后这些记录将丢失。确定要退出吗？",
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                QtWidgets.QMessageBox.No
+            )
+            if reply == QtWidgets.QMessageBox.No:
+                event.ignore()
+                return
         event.accept()
 
 
@@ -5,17 +5,102 @@ This file implements the configuration interface for fNIRS devices
 """
 
 import logging
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
                              QGroupBox, QLabel, QPushButton, QSpinBox, QComboBox, 
-                             QCheckBox, QListWidget, QListWidgetItem, QProgressBar,
-                             QTextEdit, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+                             QCheckBox, QListView, QProgressBar,
+                             QPlainTextEdit, QSplitter)
+from PyQt5.QtCore import (Qt, pyqtSignal, pyqtSlot, QTimer, QAbstractListModel, QModelIndex,
+                          QStringListModel)
 from PyQt5.QtGui import QFont
 
 logger = logging.getLogger(__name__)
 
 
+# Readable sensor type names
+_TYPE_NAMES = MappingProxyType({
+    1: "EEG",
+    2: "sEMG",
+    3: "EEG/sEMG",
+    4: "fNIRS",
+    5: "EEG/fNIRS",
+    6: "sEMG/fNIRS",
+    7: "EEG/sEMG/fNIRS"
+})
+
+
+@lru_cache(maxsize=256)
+def _format_id_bytes(sensor_id: tuple) -> str:
+    """Hex display form of a device ID, e.g. 0A-1B-2C; cached since IDs repeat on every refresh"""
+    return "-".join([f"{x:02X}" for x in sensor_id])
+
+
+@lru_cache(maxsize=64)
+def _compute_channel_pairs(lights: int, detectors: int):
+    """Standard (light, detector) channel pairs, 1-based; adjacent channels only (example logic)"""
+    return tuple((light, detector)
+                 for light in range(1, lights + 1)
+                 for detector in range(1, detectors + 1)
+                 if abs(light - detector) <= 3)
+
+
+@lru_cache(maxsize=64)
+def _channel_pair_texts(lights: int, detectors: int):
+    """Display strings for _compute_channel_pairs"""
+    return tuple(map("L{0[0]} -> D{0[1]}".format, _compute_channel_pairs(lights, detectors)))
+
+
+class DeviceListModel(QAbstractListModel):
+    """List model of connected devices: one row per device, display text cached per row"""
+    
+    def __init__(self, formatter, parent=None):
+        super().__init__(parent)
+        self._formatter = formatter  # device_info -> display text
+        self._keys = []
+        self._texts = []
+        self._devices = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._texts[index.row()]
+        if role == Qt.UserRole:
+            return self._keys[index.row()]
+        return None
+    
+    def set_devices(self, devices: Dict):
+        """Rebuild all rows (devices added or removed)"""
+        self.beginResetModel()
+        self._devices = devices
+        self._keys = list(devices)
+        self._texts = [self._formatter(info) for info in devices.values()]
+        self.endResetModel()
+    
+    def refresh_device(self, device_key) -> bool:
+        """Re-render a single row in place; False if the device is not listed"""
+        try:
+            row = self._keys.index(device_key)
+        except ValueError:
+            return False
+        self._texts[row] = self._formatter(self._devices[device_key])
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+        return True
+    
+    def device_key(self, row):
+        """Device key of a row, None when out of range"""
+        if 0 <= row < len(self._keys):
+            return self._keys[row]
+        return None
+
+
 class ConfigureWidget(QWidget):
     """Configuration interface for fNIRS devices"""
     
@@ -27,6 +112,15 @@ class ConfigureWidget(QWidget):
         super().__init__(parent)
         self.connected_devices = {}
         self.device_configurations = {}
+        # List refreshes requested while the widget was hidden, applied in showEvent
+        self._pending_device_refresh = False
+        self._pending_channel_refresh = False
+        
+        # Spin box bursts (arrow repeat, typing two digits) rebuild the channel list once
+        self._channel_refresh_timer = QTimer(self)
+        self._channel_refresh_timer.setSingleShot(True)
+        self._channel_refresh_timer.setInterval(80)
+        self._channel_refresh_timer.timeout.connect(self.update_channel_mapping)
         
         self.setupUI()
         self.connectSignals()
@@ -43,7 +137,9 @@ class ConfigureWidget(QWidget):
         device_group = QGroupBox("连接的设备")
         device_layout = QVBoxLayout(device_group)
         
-        self.device_list = QListWidget()
+        self._device_model = DeviceListModel(self._device_display_text, self)
+        self.device_list = QListView()
+        self.device_list.setModel(self._device_model)
         self.device_list.setMaximumHeight(150)
         device_layout.addWidget(self.device_list)
         
@@ -98,7 +194,10 @@ class ConfigureWidget(QWidget):
         channel_layout.addWidget(self.channel_button, 2, 0, 1, 2)
         
         # Channel mapping area
-        self.channel_list = QListWidget()
+        self._channel_model = QStringListModel(self)
+        self.channel_list = QListView()
+        self.channel_list.setModel(self._channel_model)
+        self.channel_list.setEditTriggers(QListView.NoEditTriggers)
         self.channel_list.setMaximumHeight(100)
         channel_layout.addWidget(QLabel("通道映射:"), 3, 0, 1, 2)
         channel_layout.addWidget(self.channel_list, 4, 0, 1, 2)
@@ -150,8 +249,10 @@ class ConfigureWidget(QWidget):
         info_group = QGroupBox("配置日志")
         info_group_layout = QVBoxLayout(info_group)
         
-        self.log_display = QTextEdit()
+        # Plain-text log with a bounded block count: appends stay cheap and old lines drop off
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(500)
         self.log_display.setMaximumHeight(200)
         self.log_display.setFont(QFont("Consolas", 9))
         info_group_layout.addWidget(self.log_display)
@@ -170,17 +271,24 @@ class ConfigureWidget(QWidget):
     
     def connectSignals(self):
         """Connect internal signals"""
-        self.device_list.currentRowChanged.connect(self.on_device_selected)
+        self.device_list.selectionModel().currentRowChanged.connect(self._on_current_device_changed)
         self.sample_rate_button.clicked.connect(self.on_sample_rate_set)
         self.channel_button.clicked.connect(self.on_channel_config)
         self.complete_button.clicked.connect(self.on_configuration_complete)
         
         # Auto-update channel list when spinbox values change
-        self.light_spin.valueChanged.connect(self.update_channel_mapping)
-        self.detector_spin.valueChanged.connect(self.update_channel_mapping)
+        self.light_spin.valueChanged.connect(self._schedule_channel_refresh)
+        self.detector_spin.valueChanged.connect(self._schedule_channel_refresh)
+    
+    @pyqtSlot()
+    def _schedule_channel_refresh(self):
+        """(Re)start the channel list debounce timer"""
+        # Not connected to QTimer.start directly: start(int) would take the spin value as interval
+        self._channel_refresh_timer.start()
     
     # === Device Management ===
     
+    @pyqtSlot(object, object)
     def on_device_connected(self, sensor_id, sensor_type):
         """Called when a device is connected"""
         try:
@@ -208,6 +316,7 @@ class ConfigureWidget(QWidget):
         except Exception as e:
             logger.error(f"Failed to handle device connected: {e}")
     
+    @pyqtSlot(object, object)
     def on_device_disconnected(self, sensor_id, sensor_type):
         """Called when a device is disconnected"""
         try:
@@ -225,6 +334,7 @@ class ConfigureWidget(QWidget):
         except Exception as e:
             logger.error(f"Failed to handle device disconnected: {e}")
     
+    @pyqtSlot(object, int)
     def on_battery_update(self, sensor_id, battery_level):
         """Called when battery level is updated"""
         try:
@@ -232,7 +342,11 @@ class ConfigureWidget(QWidget):
             
             if device_key in self.connected_devices:
                 self.connected_devices[device_key]['battery'] = battery_level
-                self.update_device_list()
+                # Only this device's row changes; no list rebuild
+                if not self.isVisible():
+                    self._pending_device_refresh = True
+                elif not self._device_model.refresh_device(device_key):
+                    self.update_device_list()
                 
         except Exception as e:
             logger.error(f"Failed to handle battery update: {e}")
@@ -241,39 +355,47 @@ class ConfigureWidget(QWidget):
     
     def update_device_list(self):
         """Update the device list display"""
-        self.device_list.clear()
+        if not self.isVisible():
+            self._pending_device_refresh = True
+            return
+        self._pending_device_refresh = False
+        self._device_model.set_devices(self.connected_devices)
+    
+    def _device_display_text(self, device_info):
+        """Display text of one device row"""
+        id_str = self.format_device_id(device_info['id'])
+        type_name = self.get_type_name(device_info['type'])
+        battery = device_info.get('battery', -1)
+        
+        # Status indicator
+        if device_info.get('configuration_complete', False):
+            status_icon = "✓"
+        else:
+            status_icon = "○"
         
-        for device_key, device_info in self.connected_devices.items():
-            id_str = self.format_device_id(device_info['id'])
-            type_name = self.get_type_name(device_info['type'])
-            battery = device_info.get('battery', -1)
-            
-            # Status indicator
-            if device_info.get('configuration_complete', False):
-                status_icon = "✓"
-                status_color = "#4CAF50"
-            else:
-                status_icon = "○"
-                status_color = "#FF9800"
-            
-            # Format display text
-            battery_str = f"{battery}%" if battery >= 0 else "--"
-            display_text = f"{status_icon} {id_str} ({type_name}) - 电量:{battery_str}"
-            
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.UserRole, device_key)
-            self.device_list.addItem(item)
+        # Format display text
+        battery_str = f"{battery}%" if battery >= 0 else "--"
+        return f"{status_icon} {id_str} ({type_name}) - 电量:{battery_str}"
+    
+    def _current_device_key(self):
+        """Key of the device selected in the list, None when nothing is selected"""
+        return self._device_model.device_key(self.device_list.currentIndex().row())
+    
+    @pyqtSlot(QModelIndex, QModelIndex)
+    def _on_current_device_changed(self, current, previous):
+        """Forward selection model changes as a row number"""
+        self.on_device_selected(current.row())
     
+    @pyqtSlot(int)
     def on_device_selected(self, row):
         """Handle device selection"""
         if row < 0:
             return
             
-        item = self.device_list.item(row)
-        if not item:
+        device_key = self._device_model.device_key(row)
+        if device_key is None:
             return
             
-        device_key = item.data(Qt.UserRole)
         device_info = self.connected_devices.get(device_key)
         
         if device_info:
@@ -307,30 +429,38 @@ class ConfigureWidget(QWidget):
             self.status_label.setStyleSheet("color: #f44336; font-weight: bold;")
             self.complete_button.setEnabled(False)
     
+    @pyqtSlot()
     def update_channel_mapping(self):
         """Update channel mapping display"""
-        self.channel_list.clear()
+        if not self.isVisible():
+            self._pending_channel_refresh = True
+            return
+        self._pending_channel_refresh = False
         
         lights = self.light_spin.value()
         detectors = self.detector_spin.value()
         
-        # Generate standard channel mapping (example)
-        for light in range(1, lights + 1):
-            for detector in range(1, detectors + 1):
-                if abs(light - detector) <= 3:  # Adjacent channels only
-                    channel_text = f"L{light} -> D{detector}"
-                    self.channel_list.addItem(channel_text)
+        # Standard channel mapping, cached per (lights, detectors); one model reset for the list
+        self._channel_model.setStringList(list(_channel_pair_texts(lights, detectors)))
+    
+    def showEvent(self, event):
+        """Apply list refreshes that were deferred while hidden"""
+        super().showEvent(event)
+        if self._pending_device_refresh:
+            self.update_device_list()
+        if self._pending_channel_refresh:
+            self.update_channel_mapping()
     
     # === Configuration Actions ===
     
+    @pyqtSlot()
     def on_sample_rate_set(self):
         """Handle sample rate configuration"""
         try:
-            current_item = self.device_list.currentItem()
-            if not current_item:
+            device_key = self._current_device_key()
+            if device_key is None:
                 return
             
-            device_key = current_item.data(Qt.UserRole)
             device_info = self.connected_devices.get(device_key)
             
             if not device_info:
@@ -358,14 +488,14 @@ class ConfigureWidget(QWidget):
             logger.error(f"Failed to set sample rate: {e}")
             self.log_message(f"设置采样率失败: {e}")
     
+    @pyqtSlot()
     def on_channel_config(self):
         """Handle channel configuration"""
         try:
-            current_item = self.device_list.currentItem()
-            if not current_item:
+            device_key = self._current_device_key()
+            if device_key is None:
                 return
             
-            device_key = current_item.data(Qt.UserRole)
             device_info = self.connected_devices.get(device_key)
             
             if not device_info:
@@ -374,12 +504,8 @@ class ConfigureWidget(QWidget):
             lights = self.light_spin.value()
             detectors = self.detector_spin.value()
             
-            # Generate channel pairs (example logic)
-            channel_pairs = []
-            for light in range(1, lights + 1):
-                for detector in range(1, detectors + 1):
-                    if abs(light - detector) <= 3:  # Adjacent channels
-                        channel_pairs.append([light, detector])
+            # Channel pairs (shared cached tuple, not modified)
+            channel_pairs = _compute_channel_pairs(lights, detectors)
             
             # Send network command
             self.send_network_command.emit('sendChannels', device_info['id'], device_info['type'], 
@@ -400,6 +526,7 @@ class ConfigureWidget(QWidget):
             logger.error(f"Failed to configure channels: {e}")
             self.log_message(f"通道配置失败: {e}")
     
+    @pyqtSlot()
     def on_configuration_complete(self):
         """Handle configuration completion"""
         try:
@@ -436,31 +563,19 @@ class ConfigureWidget(QWidget):
     def format_device_id(self, sensor_id):
         """Format device ID for display"""
         if isinstance(sensor_id, list):
-            return "-".join([f"{x:02X}" for x in sensor_id])
+            return _format_id_bytes(tuple(sensor_id))
         return str(sensor_id)
     
     def get_type_name(self, sensor_type):
         """Get readable type name"""
-        type_names = {
-            1: "EEG",
-            2: "sEMG", 
-            3: "EEG/sEMG",
-            4: "fNIRS",
-            5: "EEG/fNIRS",
-            6: "sEMG/fNIRS",
-            7: "EEG/sEMG/fNIRS"
-        }
-        return type_names.get(sensor_type, f"类型{sensor_type}")
+        name = _TYPE_NAMES.get(sensor_type)
+        return name if name is not None else f"类型{sensor_type}"
     
     def log_message(self, message):
         """Add message to log display"""
-        from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_display.append(f"[{timestamp}] {message}")
-        
-        # Scroll to bottom
-        scrollbar = self.log_display.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # appendPlainText keeps the view at the bottom when it already was
+        self.log_display.appendPlainText(f"[{timestamp}] {message}")
     
     # === Cleanup ===
     